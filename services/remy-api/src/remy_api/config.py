@@ -49,6 +49,7 @@ class Settings(BaseSettings):
     api_title: str = "Remy API"
     api_version: str = "0.2.0"
     debug: bool = False
+    log_level: str = "INFO"  # level for the app's own remy.* loggers
 
     # --- Auth & crypto (required, fail-closed) ---
     jwt_secret: str = ""
@@ -70,6 +71,9 @@ class Settings(BaseSettings):
     kroger_client_id: str = ""
     kroger_client_secret: str = ""
     kroger_redirect_uri: str = "http://localhost:8080/kroger/callback"
+    # Max in-flight Kroger API requests per client; a big cart's match fan-out
+    # otherwise bursts straight into 429s.
+    kroger_concurrency: int = 6
 
     # --- LLM (provider-agnostic) ---
     # LiteLLM routes off the model string ("anthropic/...", "openai/...").
@@ -78,6 +82,7 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.0
     llm_timeout: float = 60.0
     llm_max_retries: int = 0  # transport retries; validation retry is separate
+    llm_concurrency: int = 8  # max in-flight provider calls per client
     # --- Langfuse Cloud observability (optional) ---
     langfuse_enabled: bool = False
     langfuse_public_key: str = ""
@@ -32,10 +32,16 @@ def _enable_sqlite_fk(dbapi_connection, _connection_record) -> None:  # noqa: AN
     Also set a ``busy_timeout`` so a background step task (T5 runs discover/match
     as detached asyncio tasks with their own session) and a concurrent request
     session serialize writes instead of failing with "database is locked".
+
+    WAL lets those readers proceed while a writer holds the lock, and
+    ``synchronous=NORMAL`` (safe under WAL) drops the per-commit fsync of the
+    rollback journal. In-memory databases ignore the journal mode.
     """
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.close()
 
 
@@ -2,8 +2,8 @@
 
 Public surface for the planner / router / MCP facade:
 
-* Domain functions: :func:`search_products`, :func:`get_locations`,
-  :func:`add_items_to_cart`.
+* Domain functions: :func:`search_products` (short-TTL cached; see
+  :func:`clear_search_cache`), :func:`get_locations`, :func:`add_items_to_cart`.
 * OAuth/token helpers: :func:`store_tokens`, :func:`get_client`,
   :func:`close_client`, :func:`generate_pkce`, :func:`generate_state`.
 * Models: :class:`Product`, :class:`StoreLocation`, :class:`CartItemOutcome`, …
@@ -36,6 +36,7 @@ from .models import (
 )
 from .service import (
     add_items_to_cart,
+    clear_search_cache,
     close_client,
     get_client,
     get_location,
@@ -63,6 +64,7 @@ __all__ = [
     "StoreLocation",
     "add_items_to_cart",
     "banner_cart_url",
+    "clear_search_cache",
     "close_client",
     "generate_pkce",
     "generate_state",
@@ -47,6 +47,9 @@ _BANNERS: tuple[_Banner, ...] = (
     _Banner("https://www.kroger.com/cart", frozenset({"kroger"}), ("kroger",)),
 )
 
+# Chain codes are unique across banners, so the exact-match pass is one lookup.
+_CHAIN_URLS: dict[str, str] = {chain: banner.url for banner in _BANNERS for chain in banner.chains}
+
 
 def _normalize(value: str) -> str:
     """Lowercase and strip everything but alphanumerics for a stable match key."""
@@ -66,9 +69,8 @@ def banner_cart_url(chain_or_name: str | None) -> str:
     if not normalized:
         return DEFAULT_CART_URL
     # 1) Exact chain-code match (e.g. "FRED", "QFC", "KINGSOOPERS").
-    for banner in _BANNERS:
-        if normalized in banner.chains:
-            return banner.url
+    if url := _CHAIN_URLS.get(normalized):
+        return url
     # 2) Fuzzy store-name match (e.g. "Fred Meyer - Eagle Island" → fredmeyer).
     for banner in _BANNERS:
         if any(keyword in normalized for keyword in banner.name_keywords):
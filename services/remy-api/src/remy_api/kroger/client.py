@@ -41,6 +41,9 @@ DEFAULT_SCOPES = "product.compact cart.basic:write"
 APP_SCOPE = "product.compact"
 # Refresh the app/user token a little early so a request never races the expiry.
 TOKEN_SKEW_SECONDS = 60
+# Keep idle connections well past httpx's 5s default: a match run searches,
+# then spends longer than that in LLM ranking before the next Kroger call.
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
 
 
 def generate_pkce() -> tuple[str, str]:
@@ -76,16 +79,23 @@ class KrogerClient:
         self.client_id = client_id if client_id is not None else settings.kroger_client_id
         self.client_secret = client_secret if client_secret is not None else settings.kroger_client_secret
         self.redirect_uri = redirect_uri if redirect_uri is not None else settings.kroger_redirect_uri
-        self._http = http or httpx.AsyncClient(timeout=httpx.Timeout(20.0))
+        self._http = http or httpx.AsyncClient(timeout=httpx.Timeout(20.0), limits=_HTTP_LIMITS)
         self._owns_http = http is None
         self._app_token: str | None = None
         self._app_token_expiry: float = 0.0
         self._app_lock = asyncio.Lock()
+        # Bounds in-flight requests so a wide match fan-out queues locally
+        # rather than bursting into Kroger's rate limiter.
+        self._slots = asyncio.Semaphore(max(settings.kroger_concurrency, 1))
 
     async def aclose(self) -> None:
         if self._owns_http:
             await self._http.aclose()
 
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        async with self._slots:
+            return await self._http.request(method, url, **kwargs)
+
     # --- Authorize URL --------------------------------------------------------
 
     def build_authorize_url(self, *, state: str, code_challenge: str, scope: str = DEFAULT_SCOPES) -> str:
@@ -112,7 +122,7 @@ class KrogerClient:
             "Content-Type": "application/x-www-form-urlencoded",
         }
         try:
-            resp = await self._http.post(f"{self.base_url}/connect/oauth2/token", data=form, headers=headers)
+            resp = await self._send("POST", f"{self.base_url}/connect/oauth2/token", data=form, headers=headers)
         except httpx.HTTPError as exc:
             raise KrogerAPIError(f"Kroger token request failed: {exc}") from exc
         if resp.status_code == 429:
@@ -159,7 +169,7 @@ class KrogerClient:
     async def _get(self, path: str, *, access_token: str, params: dict[str, Any]) -> dict[str, Any]:
         headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
         try:
-            resp = await self._http.get(f"{self.base_url}{path}", params=params, headers=headers)
+            resp = await self._send("GET", f"{self.base_url}{path}", params=params, headers=headers)
         except httpx.HTTPError as exc:
             raise KrogerAPIError(f"Kroger request to {path} failed: {exc}") from exc
         _raise_for_status(resp, path)
@@ -198,7 +208,7 @@ class KrogerClient:
         token = await self.get_app_token()
         headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
         try:
-            resp = await self._http.get(f"{self.base_url}/locations/{location_id}", headers=headers)
+            resp = await self._send("GET", f"{self.base_url}/locations/{location_id}", headers=headers)
         except httpx.HTTPError as exc:
             raise KrogerAPIError(f"Kroger location lookup failed: {exc}") from exc
         if resp.status_code == 404:
@@ -216,7 +226,7 @@ class KrogerClient:
             "Content-Type": "application/json",
         }
         try:
-            resp = await self._http.put(f"{self.base_url}/cart/add", json={"items": items}, headers=headers)
+            resp = await self._send("PUT", f"{self.base_url}/cart/add", json={"items": items}, headers=headers)
         except httpx.HTTPError as exc:
             raise KrogerAPIError(f"Kroger cart write failed: {exc}") from exc
         _raise_for_status(resp, "/cart/add")
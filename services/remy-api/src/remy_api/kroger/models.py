@@ -79,8 +79,9 @@ def _select_image(images: list[dict[str, Any]], perspective: str = "front", size
 
     def size_url(img: dict[str, Any], want: str) -> str | None:
         for s in img.get("sizes") or []:
-            if s.get("size") == want and s.get("url"):
-                return s["url"]
+            url = s.get("url")
+            if url and s.get("size") == want:
+                return url
         return None
 
     # Prefer the requested perspective, then a featured image, then the first.
@@ -92,8 +93,9 @@ def _select_image(images: list[dict[str, Any]], perspective: str = "front", size
     # Fall back to any size on the best-ranked image.
     for img in ordered:
         for s in img.get("sizes") or []:
-            if s.get("url"):
-                return s["url"]
+            url = s.get("url")
+            if url:
+                return url
     return None
 
 
@@ -117,16 +119,19 @@ class Product(BaseModel):
 
     @classmethod
     def from_raw(cls, raw: dict[str, Any]) -> Product:
+        # Walk each nested level exactly once; every field below reads from these locals.
         items = raw.get("items") or []
         item = items[0] if items else {}
         fulfillment = item.get("fulfillment") or {}
         inventory = item.get("inventory") or {}
         categories = list(raw.get("categories") or [])
         aisles = raw.get("aisleLocations") or []
-        aisle = aisles[0].get("description") if aisles and isinstance(aisles[0], dict) else None
+        first_aisle = aisles[0] if aisles else None
+        aisle = first_aisle.get("description") if isinstance(first_aisle, dict) else None
+        product_id = raw.get("productId")
         return cls(
-            upc=raw.get("upc") or raw.get("productId") or "",
-            product_id=raw.get("productId"),
+            upc=raw.get("upc") or product_id or "",
+            product_id=product_id,
             description=raw.get("description"),
             brand=raw.get("brand"),
             size=item.get("size"),
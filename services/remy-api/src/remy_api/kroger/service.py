@@ -6,7 +6,10 @@ should call. Calling conventions (for T5):
 
 * ``search_products(session, term, location_id, limit=10, fulfillment=None)``
   → ``list[Product]``. ``fulfillment`` is ``"pickup" | "delivery" | None``.
-  Uses the shared app token (no user connection required).
+  Uses the shared app token (no user connection required). Results from the
+  shared client are cached in-process for a few minutes per (term, store,
+  limit, fulfillment), so a re-match, retry or the next plan's staples skip the
+  round trip. An explicit ``client`` bypasses the cache.
 * ``get_locations(zip_code, limit=8, chain=...)`` → ``list[StoreLocation]``.
   App token only.
 * ``add_items_to_cart(session, user_id, items)`` → ``list[CartItemOutcome]``.
@@ -18,9 +21,13 @@ All failures raise a :class:`KrogerError` subclass — never ``None`` (PRD §9.1
 
 from __future__ import annotations
 
+import re
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,6 +45,15 @@ from .models import (
     StoreLocation,
 )
 
+# Product search cache: short TTL so price/stock drift stays small.
+_SEARCH_TTL_SECONDS = 300.0
+_SEARCH_CACHE_SIZE = 512
+_WHITESPACE = re.compile(r"\s+")
+# Entries hold the results serialized once; each hit validates a fresh list
+# from the JSON, which is several times cheaper than deep-copying the models.
+_PRODUCT_LIST = TypeAdapter(list[Product])
+_search_cache: OrderedDict[tuple[str, str, int, str | None], tuple[float, bytes]] = OrderedDict()
+
 # Process-wide client singleton (owns the app-token cache + httpx pool).
 _client: KrogerClient | None = None
 
@@ -92,8 +108,7 @@ async def store_tokens(session: AsyncSession, user_id: str, bundle: KrogerTokenB
     return token
 
 
-def _is_expired(token: KrogerToken, *, skew: int = TOKEN_SKEW_SECONDS) -> bool:
-    expires_at = token.expires_at
+def _is_expired(expires_at: datetime, *, skew: int = TOKEN_SKEW_SECONDS) -> bool:
     if expires_at.tzinfo is None:
         expires_at = expires_at.replace(tzinfo=UTC)
     return datetime.now(UTC) >= expires_at - timedelta(seconds=skew)
@@ -105,7 +120,7 @@ async def _valid_access_token(
     token = await _load_token(session, user_id)
     if token is None:
         raise KrogerNotConnectedError("Kroger not connected — visit Settings to connect your account.")
-    if not force_refresh and not _is_expired(token):
+    if not force_refresh and not _is_expired(token.expires_at):
         return token.access_token
     if not token.refresh_token:
         raise KrogerNotConnectedError("Kroger session expired and cannot be refreshed — reconnect in Settings.")
@@ -155,10 +170,33 @@ async def search_products(
     """Search products at ``location_id``. ``session`` is accepted for a uniform
     call signature with the cart function (and future per-user tuning) but the
     product endpoint uses the shared app token, so no user connection is needed.
+
+    Only searches through the shared client are cached: an explicit ``client``
+    may point at another account or endpoint, so it always fetches.
     """
-    kroger = _resolve(client)
-    raw = await kroger.get_products_raw(term=term, location_id=location_id, limit=limit, fulfillment=fulfillment)
-    return [Product.from_raw(p) for p in raw.get("data") or []]
+    if client is not None:
+        raw = await client.get_products_raw(term=term, location_id=location_id, limit=limit, fulfillment=fulfillment)
+        return [Product.from_raw(p) for p in raw.get("data") or []]
+
+    key = (_WHITESPACE.sub(" ", term.strip().lower()), location_id, limit, fulfillment)
+    now = time.monotonic()
+    hit = _search_cache.get(key)
+    if hit is not None and hit[0] > now:
+        _search_cache.move_to_end(key)
+        return _PRODUCT_LIST.validate_json(hit[1])
+
+    raw = await get_client().get_products_raw(term=term, location_id=location_id, limit=limit, fulfillment=fulfillment)
+    products = [Product.from_raw(p) for p in raw.get("data") or []]
+    _search_cache[key] = (now + _SEARCH_TTL_SECONDS, _PRODUCT_LIST.dump_json(products))
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return products
+
+
+def clear_search_cache() -> None:
+    """Forget cached product searches (tests; store data known to be stale)."""
+    _search_cache.clear()
 
 
 async def add_items_to_cart(
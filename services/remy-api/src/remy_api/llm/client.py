@@ -6,6 +6,11 @@ a Pydantic model, and retries exactly once (feeding the validation error back)
 before raising. It never returns ``None`` and never strips markdown fences as a
 parsing strategy (PRD §7.1, §9).
 
+Deterministic calls (temperature 0, text-only) are memoized per client in a
+small LRU keyed by a content hash of model + prompt id/version + schema + the
+rendered text, so a repeated list line or ranking input skips the provider round
+trip entirely.
+
 Provider is a config swap: LiteLLM routes off the model string
 (``anthropic/...``, ``openai/...``, ``ollama/...``) and reads the matching
 provider API key from its standard env name natively.
@@ -13,8 +18,12 @@ provider API key from its standard env name natively.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, TypeVar
 
 import litellm
@@ -36,12 +45,36 @@ T = TypeVar("T", bound=BaseModel)
 # Don't let LiteLLM mutate/drop our messages or add extra provider params.
 litellm.drop_params = True
 
+# Max validated responses kept per client for deterministic prompts.
+_RESPONSE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=32)
+def _output_mode(model: str) -> str | None:
+    """``"schema"``, ``"json"`` or ``None`` for ``model`` — probed once per model.
+
+    The probe walks LiteLLM's model map; the answer never changes for a model
+    string within a process, so it is not worth repeating on every call.
+    """
+    try:
+        if litellm.supports_response_schema(model=model):
+            return "schema"
+        if "response_format" in (litellm.get_supported_openai_params(model=model) or []):
+            return "json"
+    except Exception:  # noqa: BLE001 - capability probe must never break the call
+        pass
+    return None
+
 
 class LLMClient:
     """Thin wrapper around ``litellm.acompletion`` for structured output."""
 
     def __init__(self, settings: ProviderSettings | None = None) -> None:
         self._settings = settings or get_provider_settings()
+        self._cache: OrderedDict[str, BaseModel] = OrderedDict()
+        # Caps concurrent provider calls so wide fan-outs queue here instead of
+        # tripping the provider's rate limit.
+        self._slots = asyncio.Semaphore(max(self._settings.llm_concurrency, 1))
 
     @property
     def model(self) -> str:
@@ -55,6 +88,18 @@ class LLMClient:
             LLMEmptyResponseError: the provider returned no content.
             LLMValidationError: output failed validation twice (initial + retry).
         """
+        key = self._cache_key(prompt, schema)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key].model_copy(deep=True)  # type: ignore[return-value]
+        result = await self._structured(prompt, schema)
+        if key is not None:
+            self._cache[key] = result.model_copy(deep=True)
+            if len(self._cache) > _RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    async def _structured(self, prompt: RenderedPrompt, schema: type[T]) -> T:
         messages: list[dict[str, Any]] = [
             {"role": "system", "content": prompt.system},
             {"role": "user", "content": self._user_content(prompt)},
@@ -63,7 +108,7 @@ class LLMClient:
         raw = await self._complete(messages, prompt.temperature, schema, prompt)
         try:
             return self._parse(raw, schema)
-        except (json.JSONDecodeError, ValidationError) as first_err:
+        except ValidationError as first_err:
             # Bind to an outer name: Python clears the `except` variable after the block.
             error = first_err
             logger.warning(
@@ -89,7 +134,7 @@ class LLMClient:
         raw_retry = await self._complete(messages, prompt.temperature, schema, prompt)
         try:
             return self._parse(raw_retry, schema)
-        except (json.JSONDecodeError, ValidationError) as second_err:
+        except ValidationError as second_err:
             raise LLMValidationError(
                 f"LLM output for prompt {prompt.prompt_id} v{prompt.version} "
                 f"failed validation after retry: {self._format_error(second_err)}",
@@ -98,6 +143,23 @@ class LLMClient:
 
     # -- internals ---------------------------------------------------------
 
+    def _cache_key(self, prompt: RenderedPrompt, schema: type[BaseModel]) -> str | None:
+        """Content hash for a cacheable call, or ``None`` (sampled / multimodal)."""
+        if prompt.temperature != 0 or prompt.images:
+            return None
+        digest = hashlib.sha256()
+        for part in (
+            self._settings.llm_model,
+            prompt.prompt_id,
+            str(prompt.version),
+            f"{schema.__module__}.{schema.__qualname__}",
+            prompt.system,
+            prompt.user,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     @staticmethod
     def _user_content(prompt: RenderedPrompt) -> str | list[dict[str, Any]]:
         """Build the user turn: a plain string, or content-parts when images.
@@ -128,25 +190,21 @@ class LLMClient:
             "timeout": self._settings.llm_timeout,
             "num_retries": self._settings.llm_max_retries,
         }
-        # Ask for native structured output where the provider/model supports it.
-        # Where it doesn't, the prompt's own JSON contract carries the load and
-        # validation + the retry loop catch drift.
-        try:
-            if litellm.supports_response_schema(model=self._settings.llm_model):
-                kwargs["response_format"] = schema
-        except Exception:  # noqa: BLE001 - capability probe must never break the call
-            pass
+        response_format = self._response_format(schema)
+        if response_format is not None:
+            kwargs["response_format"] = response_format
 
         try:
-            response = await observe_generation(
-                lambda: litellm.acompletion(**kwargs),
-                name=prompt.prompt_id,
-                version=prompt.version,
-                model=self._settings.llm_model,
-                model_parameters={"temperature": temperature},
-                input=messages,
-                tags=["structured-generation"],
-            )
+            async with self._slots:
+                response = await observe_generation(
+                    lambda: litellm.acompletion(**kwargs),
+                    name=prompt.prompt_id,
+                    version=prompt.version,
+                    model=self._settings.llm_model,
+                    model_parameters={"temperature": temperature},
+                    input=messages,
+                    tags=["structured-generation"],
+                )
         except Exception as exc:  # noqa: BLE001 - normalize any provider/transport error
             raise LLMAPIError(f"LLM provider call failed ({self._settings.llm_model}): {exc}") from exc
 
@@ -159,10 +217,27 @@ class LLMClient:
             raise LLMEmptyResponseError("LLM returned empty content")
         return content
 
+    def _response_format(self, schema: type[BaseModel]) -> type[BaseModel] | dict[str, str] | None:
+        """Strongest structured-output mode the model supports.
+
+        Native JSON-schema output where available; otherwise plain JSON mode, so
+        the model stops at the closing brace instead of adding prose the
+        validator would bounce (a wasted retry round trip). With neither, the
+        prompt's own JSON contract carries the load and validation + the retry
+        loop catch drift.
+        """
+        mode = _output_mode(self._settings.llm_model)
+        if mode == "schema":
+            return schema
+        if mode == "json":
+            return {"type": "json_object"}
+        return None
+
     @staticmethod
     def _parse(raw: str, schema: type[T]) -> T:
-        data = json.loads(raw)
-        return schema.model_validate(data)
+        # pydantic-core parses and validates in one native pass (no interim
+        # dict); malformed JSON surfaces as a ``json_invalid`` ValidationError.
+        return schema.model_validate_json(raw)
 
     @staticmethod
     def _format_error(err: Exception) -> str:
@@ -0,0 +1,55 @@
+"""Non-blocking log emission for Remy's own loggers.
+
+The planner logs from many concurrent tasks (match fan-out, per-meal discover).
+A stream handler formats and writes under a lock on the event-loop thread, so a
+burst of warnings stalls every task behind stdout. Instead each record is an
+O(1) enqueue on a :class:`~logging.handlers.QueueHandler`; a
+:class:`~logging.handlers.QueueListener` thread does the formatting and writing.
+
+Only the ``remy`` and ``remy_api`` logger trees are wired up — uvicorn keeps its
+own logging config. Started/stopped by the app lifespan.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_LOGGER_NAMES = ("remy", "remy_api")
+_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener: QueueListener | None = None
+_handler: QueueHandler | None = None
+
+
+def start_log_queue(level: str = "INFO") -> None:
+    """Route the app loggers through a background writer thread (idempotent)."""
+    global _listener, _handler
+    if _listener is not None:
+        return
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(_FORMAT))
+    _handler = QueueHandler(records)
+    for name in _LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.addHandler(_handler)
+        logger.setLevel(level.upper())
+        logger.propagate = False
+    _listener = QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_log_queue() -> None:
+    """Flush queued records and detach the handler."""
+    global _listener, _handler
+    if _listener is None:
+        return
+    _listener.stop()
+    for name in _LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.removeHandler(_handler)
+        logger.propagate = True
+    _listener = None
+    _handler = None
@@ -20,6 +20,8 @@ from remy_api.db import dispose_engine, init_db
 from remy_api.errors import register_error_handlers
 from remy_api.kroger import close_client, register_kroger_error_handler
 from remy_api.llm.errors import LLMError
+from remy_api.logs import start_log_queue, stop_log_queue
+from remy_api.net import close_http_client
 from remy_api.observability import shutdown_langfuse
 from remy_api.routers import admin, auth, kroger, orders, plan, recipes, users, usuals
 from remy_api.search.base import SearchError
@@ -31,6 +33,7 @@ settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app_: FastAPI) -> AsyncIterator[None]:
+    start_log_queue(settings.log_level)
     # No Alembic in v1; create tables on startup (models are kept clean enough
     # to add migrations later).
     await init_db()
@@ -42,8 +45,10 @@ async def lifespan(app_: FastAPI) -> AsyncIterator[None]:
             await stack.enter_async_context(mcp_ctx)
         yield
     await close_client()
+    await close_http_client()
     shutdown_langfuse()
     await dispose_engine()
+    stop_log_queue()
 
 
 app = FastAPI(title=settings.api_title, version=settings.api_version, lifespan=lifespan)
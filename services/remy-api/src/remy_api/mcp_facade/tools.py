@@ -189,11 +189,11 @@ def build_mcp_server() -> FastMCP:
                     raise _fail(f"Meal {c.meal_id}: provide candidate_id, url, or skip.")
                 mapped.append(MealChoice(meal_id=c.meal_id, choice=choice, candidate_id=c.candidate_id, url=c.url))
             try:
-                await machine.submit_selection(session, user, mapped)
+                plan = await machine.submit_selection(session, user, mapped)
             except APIError as exc:
                 raise _fail(exc.message) from exc
-            user_id = user.id
-        snapshot = await _read(user_id)
+            # The step ran in this request and returned the refreshed row; no re-read needed.
+            snapshot = machine.snapshot(plan)
         result = serialize.selections_view(snapshot)
         if snapshot.status == PlanStatus.REVIEWING_LIST:
             result["shopping_list"] = serialize.shopping_list_view(snapshot)
@@ -215,9 +215,7 @@ def build_mcp_server() -> FastMCP:
             plan = await _active_plan(session, user.id, plan_draft_id)
             if plan.status in (PlanStatus.DISCOVERING, PlanStatus.SELECTING):
                 raise _fail(f"The shopping list isn't ready (plan is '{plan.status}'). Finish select_recipes first.")
-            user_id = user.id
-        snapshot = await _read(user_id)
-        return serialize.shopping_list_view(snapshot)
+            return serialize.shopping_list_view(machine.snapshot(plan))
 
     @mcp.tool(
         description=(
@@ -237,12 +235,10 @@ def build_mcp_server() -> FastMCP:
                 raise _fail(f"The list can only be edited while reviewing it (plan is '{plan.status}').")
             ops = [ListEdit(op=e.op, line_id=e.line_id, quantity=e.quantity, unit=e.unit, text=e.text) for e in edits]
             try:
-                await machine.list_edits(session, user, ops)
+                plan = await machine.list_edits(session, user, ops)
             except APIError as exc:
                 raise _fail(exc.message) from exc
-            user_id = user.id
-        snapshot = await _read(user_id)
-        return serialize.shopping_list_view(snapshot)
+            return serialize.shopping_list_view(machine.snapshot(plan))
 
     # -- flow: match ----------------------------------------------------------
 
@@ -307,12 +303,10 @@ def build_mcp_server() -> FastMCP:
             else:
                 op = CartEdit(op="swap", item_id=line_id, alternative_id=alternative_id)
             try:
-                await machine.cart_edits(session, user, [op])
+                plan = await machine.cart_edits(session, user, [op])
             except APIError as exc:
                 raise _fail(exc.message) from exc
-            user_id = user.id
-        snapshot = await _read(user_id)
-        return serialize.cart_view(snapshot)
+            return serialize.cart_view(machine.snapshot(plan))
 
     # -- flow: execute --------------------------------------------------------
 
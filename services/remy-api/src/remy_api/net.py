@@ -9,14 +9,39 @@ escalate to impersonation.
 
 Both the recipe scraper (page fetch) and the og:image thumbnail fetcher share
 :func:`impersonated_get` so the fallback lives in exactly one place.
+
+:func:`get_http_client` is the process-wide pooled ``httpx`` client for plain
+outbound requests (web search, page fetch, og:image and image downloads).
+Reusing it keeps TCP/TLS connections alive across calls instead of paying a
+fresh handshake per request; callers pass their own per-request
+``timeout``/``headers``/``follow_redirects``. The impersonation fallback likewise
+keeps one ``curl_cffi`` session open rather than a fresh one per fetch. The app
+lifespan closes both on shutdown.
+
+Both shared clients are used for every user's fetches, so neither keeps
+cookies between requests: a cookie one site sets for one user's fetch must not
+be replayed on the next, and a process-lifetime jar would only grow.
 """
 
 from __future__ import annotations
 
+import asyncio
+import http.cookiejar
 import logging
+from typing import Any
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+_HTTP_TIMEOUT = httpx.Timeout(10.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+_http_client: httpx.AsyncClient | None = None
+# curl_cffi session for the fallback path, and the loop it was opened on (a
+# session is bound to its event loop; a new loop gets a new session).
+_impersonation: tuple[Any, asyncio.AbstractEventLoop] | None = None
+
 # Response statuses that typically signal a bot wall / TLS-fingerprint rejection
 # (worth retrying with impersonation) rather than a genuine client/not-found
 # error. 403 is the seriouseats case; 406/429/503 are common Cloudflare/WAF
@@ -24,6 +49,57 @@ logger = logging.getLogger(__name__)
 BLOCKED_STATUSES = frozenset({403, 406, 429, 503})
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled outbound client, creating it lazily."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # A jar whose policy allows no domain: responses' Set-Cookie is dropped.
+        no_cookies = http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        _http_client = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS, cookies=no_cookies)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled clients (app shutdown / test teardown)."""
+    global _http_client, _impersonation
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _impersonation is not None:
+        session, loop = _impersonation
+        _impersonation = None
+        if loop is asyncio.get_running_loop():
+            await session.close()
+        else:
+            _close_on_loop(session, loop)
+
+
+def _close_on_loop(session: Any, loop: asyncio.AbstractEventLoop) -> None:  # noqa: ANN401
+    """Close a ``curl_cffi`` session that belongs to another event loop.
+
+    Its async ``close`` has to run on its own loop, so it is scheduled there
+    while that loop still runs. A session whose loop has already stopped (only
+    tests switch loops) is just dropped: its curl handles are freed when it is
+    garbage-collected, but the libcurl multi handle is not.
+    """
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+def _impersonation_session() -> Any:  # noqa: ANN401 - curl_cffi is imported lazily
+    """Return the shared ``curl_cffi`` session for the running loop."""
+    global _impersonation
+    from curl_cffi import AsyncSession  # lazy: heavy, fallback-only
+
+    loop = asyncio.get_running_loop()
+    if _impersonation is None or _impersonation[1] is not loop:
+        if _impersonation is not None:
+            _close_on_loop(*_impersonation)
+        # discard_cookies: responses' cookies are not stored on the session.
+        _impersonation = (AsyncSession(discard_cookies=True), loop)
+    return _impersonation[0]
+
+
 async def impersonated_get(
     url: str,
     *,
@@ -40,18 +116,15 @@ async def impersonated_get(
 
     ``curl_cffi`` is imported lazily so it is only loaded on the fallback path.
     """
-    from curl_cffi import AsyncSession  # lazy: heavy, fallback-only
-
-    async with AsyncSession() as session:
-        resp = await session.get(
-            url,
-            headers=headers,
-            timeout=timeout,
-            impersonate="chrome",
-            allow_redirects=True,
-        )
-        content = resp.content
-        if max_bytes is not None:
-            content = content[: max_bytes + 1]
-        ctype = resp.headers.get("content-type", "") or ""
-        return resp.status_code, content, ctype
+    resp = await _impersonation_session().get(
+        url,
+        headers=headers,
+        timeout=timeout,
+        impersonate="chrome",
+        allow_redirects=True,
+    )
+    content = resp.content
+    if max_bytes is not None:
+        content = content[: max_bytes + 1]
+    ctype = resp.headers.get("content-type", "") or ""
+    return resp.status_code, content, ctype
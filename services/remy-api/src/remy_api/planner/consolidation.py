@@ -19,6 +19,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from fractions import Fraction
+from functools import lru_cache
 
 # --- Unit table --------------------------------------------------------------
 # Each known unit maps to (family, factor-to-base). Units in the same family are
@@ -142,7 +143,7 @@ def _render_segment(
 # --- Data shapes -------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedContribution:
     """One parsed ingredient line feeding consolidation."""
 
@@ -155,14 +156,14 @@ class ParsedContribution:
     note: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     unit: str | None
     quantity: float | None
     display: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedLine:
     food: str
     segments: list[Segment]
@@ -180,13 +181,16 @@ def _normalize_food(food: str | None, raw: str) -> str:
     return f or raw.strip().lower()
 
 
+_CONSONANT_Y = re.compile(r"[^aeiou]y$")
+
+
 def _plural_form(food: str) -> str:
     """A small inflector used only when the source line confirms the plural."""
     words = food.split()
     if not words:
         return food
     last = words[-1]
-    if re.search(r"[^aeiou]y$", last):
+    if _CONSONANT_Y.search(last):
         plural = f"{last[:-1]}ies"
     elif last.endswith(("s", "x", "z", "ch", "sh", "o")):
         plural = f"{last}es"
@@ -295,25 +299,70 @@ def consolidate(contributions: list[ParsedContribution]) -> list[ConsolidatedLin
 # --- Pantry bypass (FR-11) ---------------------------------------------------
 
 
-def _compile_pantry(pantry_items: list[str]) -> list[re.Pattern[str]]:
-    patterns: list[re.Pattern[str]] = []
-    for item in pantry_items:
-        term = (item or "").strip().lower()
-        if not term:
-            continue
-        patterns.append(re.compile(rf"\b{re.escape(term)}\b"))
-    return patterns
+def _trie_alternation(terms: tuple[str, ...]) -> str:
+    """Prefix-factored alternation matching exactly ``terms``.
+
+    "salt", "sugar", "soy sauce" become ``s(?:alt|oy sauce|ugar)``: the engine
+    walks shared prefixes once instead of retrying every term at each position,
+    which is the Aho-Corasick idea within the stdlib ``re`` engine.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-term marker
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:  # a term may also end here
+            body = f"(?:{body})?"
+        return body
+
+    return emit(trie)
+
+
+@lru_cache(maxsize=64)
+def _pantry_regex(terms: tuple[str, ...]) -> re.Pattern[str] | None:
+    """One word-boundary, prefix-factored pattern over every pantry term,
+    compiled once per distinct pantry."""
+    if not terms:
+        return None
+    return re.compile(rf"\b(?:{_trie_alternation(terms)})\b")
+
+
+def _compile_pantry(pantry_items: list[str]) -> re.Pattern[str] | None:
+    terms = {term for item in pantry_items if (term := (item or "").strip().lower())}
+    return _pantry_regex(tuple(sorted(terms)))
 
 
-def matches_pantry(food: str, pantry_patterns: list[re.Pattern[str]]) -> bool:
+def matches_pantry(food: str, pantry_pattern: re.Pattern[str] | None) -> bool:
     """True if any pantry term matches ``food`` on a word boundary (FR-11)."""
+    if pantry_pattern is None:
+        return False
     target = (food or "").strip().lower()
     if not target:
         return False
-    return any(p.search(target) for p in pantry_patterns)
+    return pantry_pattern.search(target) is not None
 
 
 def classify_pantry(foods: list[str], pantry_items: list[str]) -> dict[str, bool]:
-    """Map each food -> True if it is a pantry staple (word-boundary match)."""
-    patterns = _compile_pantry(pantry_items)
-    return {food: matches_pantry(food, patterns) for food in foods}
+    """Map each food -> True if it is a pantry staple (word-boundary match).
+
+    Each distinct normalized food is scanned once and the flag broadcast back,
+    so "Garlic" and "garlic " cost one search; an empty pantry scans nothing.
+    """
+    pattern = _compile_pantry(pantry_items)
+    if pattern is None:
+        return dict.fromkeys(foods, False)
+    flags: dict[str, bool] = {}
+    result: dict[str, bool] = {}
+    for food in foods:
+        target = (food or "").strip().lower()
+        if target not in flags:
+            flags[target] = bool(target) and pattern.search(target) is not None
+        result[food] = flags[target]
+    return result
@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 
 from sqlalchemy import select
@@ -27,26 +29,38 @@ from remy_api.search.base import SearchError, SearchResult
 logger = logging.getLogger("remy.planner.discover")
 
 _MEAL_CONCURRENCY = 6
+# Upper bound on one meal's whole discovery (searches, filters, thumbnails). Every
+# leg has its own transport timeout; this caps the sum so one slow meal can't hold
+# the step open indefinitely.
+_MEAL_TIMEOUT_SECONDS = 120.0
 _MAX_CANDIDATES = 5
 _MAX_FAVORITE_SITES = 4
 _SAVED_SEARCH_LIMIT = 8
 
 
+@lru_cache(maxsize=1024)
+def _host_path(url: str) -> tuple[str, str]:
+    """(lowercased host without ``www.``, path) — one parse shared by both helpers.
+
+    A candidate URL is parsed for its source domain and again for dedup; caching
+    the split makes the second lookup free.
+    """
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    return (host[4:] if host.startswith("www.") else host), parsed.path
+
+
 def _domain(url: str | None) -> str | None:
     if not url:
         return None
-    netloc = urlparse(url).netloc.lower()
-    return netloc[4:] if netloc.startswith("www.") else netloc or None
+    return _host_path(url)[0] or None
 
 
 def _normalize_url(url: str | None) -> str | None:
     if not url:
         return None
-    parsed = urlparse(url)
-    host = parsed.netloc.lower()
-    host = host[4:] if host.startswith("www.") else host
-    path = parsed.path.rstrip("/").lower()
-    return f"{host}{path}" if host else url.rstrip("/").lower()
+    host, path = _host_path(url)
+    return f"{host}{path.rstrip('/').lower()}" if host else url.rstrip("/").lower()
 
 
 def _dedup(candidates: list[Candidate]) -> list[Candidate]:
@@ -91,7 +105,7 @@ async def _discover_saved(meal: Meal, user_id: str) -> list[Candidate]:
                 "source_url": r.source_url,
                 "total_time": r.total_time,
                 "has_image": bool(r.image_path),
-                "key_ingredients": [ing.food or ing.raw for ing in r.ingredients][:8],
+                "key_ingredients": [ing.food or ing.raw for ing in islice(r.ingredients, 8)],
             }
             for r in recipes
         ]
@@ -158,10 +172,8 @@ async def _web_search(meal: Meal, favorite_sites: list[str]) -> list[tuple[Searc
         except SearchError as exc:
             return exc
 
-    fav_out, gen_out = await asyncio.gather(
-        asyncio.gather(*(fav(s) for s in sites)) if sites else _empty(),
-        general(),
-    )
+    # One flat gather over every leg (general + each favorite site).
+    gen_out, *fav_out = await asyncio.gather(general(), *(fav(s) for s in sites))
 
     any_ok = False
     pairs: list[tuple[SearchResult, bool]] = []
@@ -183,10 +195,6 @@ async def _web_search(meal: Meal, favorite_sites: list[str]) -> list[tuple[Searc
     return pairs
 
 
-async def _empty() -> list:
-    return []
-
-
 async def _discover_web(meal: Meal, favorite_sites: list[str]) -> list[Candidate]:
     pairs = await _web_search(meal, favorite_sites)
     if not pairs:
@@ -292,12 +300,12 @@ async def discover_meal(meal: Meal, favorite_sites: list[str], user_id: str) ->
         return_exceptions=True,
     )
     if isinstance(saved_res, Exception):
-        logger.info("saved discovery failed for %r: %s", meal.query, saved_res)
+        logger.warning("saved discovery failed for %r: %s", meal.query, saved_res)
         source_errors.append("saved_search_failed")
     else:
         saved = saved_res
     if isinstance(web_res, Exception):
-        logger.info("web discovery failed for %r: %s", meal.query, web_res)
+        logger.warning("web discovery failed for %r: %s", meal.query, web_res)
         source_errors.append("web_search_failed")
     else:
         web = web_res
@@ -356,14 +364,27 @@ async def run_discover(plan_id: str) -> None:
 
     write_lock = asyncio.Lock()
     sem = asyncio.Semaphore(_MEAL_CONCURRENCY)
+    # Meals identical but for their id (the same dish asked for twice) share
+    # one discovery; each still gets its own row under its own meal_id.
+    shared: dict[tuple[str, str, bool, str | None], asyncio.Task[MealCandidates]] = {}
 
-    async def _one(meal: Meal) -> None:
+    async def _discover(meal: Meal) -> MealCandidates:
         async with sem:
             try:
-                mc = await discover_meal(meal, favorite_sites, user_id)
+                async with asyncio.timeout(_MEAL_TIMEOUT_SECONDS):
+                    return await discover_meal(meal, favorite_sites, user_id)
+            except TimeoutError:
+                logger.warning("discover_meal timed out for %r", meal.query)
+                return MealCandidates(meal_id=meal.id, status=MealStatus.ERROR, source_errors=["discover_timeout"])
             except Exception as exc:  # noqa: BLE001 - never let one meal sink the run
                 logger.warning("discover_meal crashed for %r: %s", meal.query, exc)
-                mc = MealCandidates(meal_id=meal.id, status=MealStatus.ERROR, source_errors=["discover_error"])
+                return MealCandidates(meal_id=meal.id, status=MealStatus.ERROR, source_errors=["discover_error"])
+
+    async def _one(meal: Meal) -> None:
+        key = (meal.query, meal.verbatim, meal.is_specific, meal.url)
+        if key not in shared:
+            shared[key] = asyncio.create_task(_discover(meal))
+        mc = (await shared[key]).model_copy(update={"meal_id": meal.id})
         async with write_lock, factory() as s:
             plan = await s.get(Plan, plan_id)
             if plan is None or plan.status == PlanStatus.ABANDONED:
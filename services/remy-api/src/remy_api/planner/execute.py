@@ -54,7 +54,12 @@ async def execute_plan(session: AsyncSession, plan: Plan) -> None:
     plan.status = PlanStatus.EXECUTING
     await session.commit()
 
-    request_items = [{"upc": it.chosen.upc, "quantity": max(it.count, 1), "modality": modality} for it in addable]
+    # One PUT for the whole cart, one entry per UPC: two lines matched to the same
+    # product are summed rather than sent as duplicate cart entries.
+    quantities: dict[str, int] = {}
+    for it in addable:
+        quantities[it.chosen.upc] = quantities.get(it.chosen.upc, 0) + max(it.count, 1)
+    request_items = [{"upc": upc, "quantity": qty, "modality": modality} for upc, qty in quantities.items()]
     outcomes = await deps.kroger_add_items_to_cart(session, plan.user_id, request_items) if request_items else []
     outcome_by_upc = {o.upc: o for o in outcomes}
 
@@ -148,7 +148,9 @@ def _to_list_line(line: ConsolidatedLine, is_pantry: bool) -> ListLine:
 
 async def build_list(session: AsyncSession, plan: Plan) -> None:
     """Build ``plan.list_lines`` from the selected recipes (mutates + persists)."""
-    selections = {mid: SelectionState(**s) for mid, s in (plan.selections or {}).items()}
+    # Rows the select step wrote via model_dump(mode="json"): trusted, flat, and
+    # only read here, so skip re-validation.
+    selections = {mid: SelectionState.model_construct(**s) for mid, s in (plan.selections or {}).items()}
     recipe_refs: list[tuple[str, str]] = []
     for sel in selections.values():
         if sel.status == SelectionStatus.SAVED and sel.recipe_id:
@@ -21,7 +21,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import uuid
+from urllib.parse import urlparse
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -47,6 +49,9 @@ logger = logging.getLogger("remy.planner.machine")
 
 _TERMINAL = {PlanStatus.DONE, PlanStatus.ABANDONED}
 
+# A message that is nothing but pasted recipe links needs no P1 call.
+_URL_TOKEN = re.compile(r"https?://\S+")
+
 _locks: dict[str, asyncio.Lock] = {}
 _tasks: dict[str, asyncio.Task] = {}
 
@@ -89,6 +94,7 @@ async def get_active_plan(session: AsyncSession, user_id: str) -> Plan | None:
         select(Plan)
         .where(Plan.user_id == user_id, Plan.status.notin_(list(_TERMINAL)))
         .order_by(Plan.created_at.desc())
+        .limit(1)
     )
     return row.scalars().first()
 
@@ -111,7 +117,26 @@ def _require_status(plan: Plan, expected: PlanStatus) -> None:
 # --- create / discover -------------------------------------------------------
 
 
+def _url_only_meals(text: str) -> list[Meal] | None:
+    """Meals for a blank or links-only message, built without P1; else ``None``.
+
+    Mirrors what P1 emits for a pasted URL (empty query, specific, domain label).
+    Anything with free text still goes to the model so vagueness is preserved.
+    """
+    tokens = text.split()
+    if not all(_URL_TOKEN.fullmatch(t) for t in tokens):
+        return None
+    meals: list[Meal] = []
+    for url in dict.fromkeys(tokens):
+        host = urlparse(url).netloc.lower().removeprefix("www.")
+        meals.append(Meal(id=uuid.uuid4().hex, query="", verbatim=host or "pasted link", is_specific=True, url=url))
+    return meals
+
+
 async def _extract_meals(text: str) -> list[Meal]:
+    fast = _url_only_meals(text)
+    if fast is not None:
+        return fast
     out = await deps.get_llm_client().structured(
         meal_extraction.render(meal_extraction.MealExtractionInput(text=text)),
         meal_extraction.MealExtractionOutput,
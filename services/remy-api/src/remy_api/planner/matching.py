@@ -2,11 +2,12 @@
 
 Background step. First one batched P4 call turns approved list lines into
 grocery search terms + package quantities (per-item P4-single fallback if the
-batch fails validation). Then, per extracted product (bounded concurrency), search
-Kroger at the preferred store, LLM-rank the results (P5, price + target_size
-aware), and run the deterministic stock/fulfillment substitution walk (A.8) to
-pick the best obtainable product with up to 3 alternatives. Produces a cart draft
-with per-line status, chosen product, alternatives, and a live estimated total.
+batch fails validation). Then every extracted product is searched at the
+preferred store (bounded concurrency), the results are LLM-ranked in batches
+(P5, price + target_size aware; per-item P5 fallback), and each item runs the
+deterministic stock/fulfillment substitution walk (A.8) to pick the best
+obtainable product with up to 3 alternatives. Produces a cart draft with
+per-line status, chosen product, alternatives, and a live estimated total.
 Results persist incrementally so ``GET /plan/state`` streams per-item progress.
 """
 
@@ -15,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from itertools import islice
 
 from sqlalchemy import select
 
@@ -41,6 +43,9 @@ logger = logging.getLogger("remy.planner.matching")
 
 _ITEM_CONCURRENCY = 6
 _SEARCH_LIMIT = 10
+# Items per batched P5 call: big enough to collapse a cart into a few round trips,
+# small enough that each prompt stays focused and progress still streams.
+_RANK_BATCH_SIZE = 8
 
 _STATUS_MAP = {
     MatchStatus.MATCHED: ItemStatus.MATCHED,
@@ -81,8 +86,9 @@ def _usual_from_products(
     item.is_usual = True
     item.status = ItemStatus.MATCHED if prod.stock_level in _CONFIRMED_STOCK else ItemStatus.STOCK_UNKNOWN
     item.alternatives = [
-        Alternative(alternative_id=p.upc, **_product_ref(p).model_dump()) for p in products if p.upc != prod.upc
-    ][:3]
+        Alternative(alternative_id=p.upc, **_product_ref(p).model_dump())
+        for p in islice((p for p in products if p.upc != prod.upc), 3)
+    ]
     return True
 
 
@@ -111,50 +117,66 @@ def _line_to_parsed(line: ListLine) -> product_extraction.ParsedLine:
     return product_extraction.ParsedLine(quantity=line.quantity, unit=line.unit, food=line.food, note=line.note)
 
 
-async def _extract_products(lines: list[ListLine]) -> dict[str, list[product_extraction.ExtractedProduct]]:
-    """P4 batch extraction with a per-item P4-single fallback (A.4)."""
-    client = deps.get_llm_client()
-    result: dict[str, list[product_extraction.ExtractedProduct]] = {ln.id: [] for ln in lines}
-    parsed_lines = [_line_to_parsed(ln) for ln in lines]
+async def _extract_batch(
+    lines: list[ListLine], result: dict[str, list[product_extraction.ExtractedProduct]]
+) -> list[ListLine]:
+    """One P4 batch call over ``lines``; fills ``result`` and returns lines it skipped."""
+    out = await deps.get_llm_client().structured(
+        product_extraction.render_batch(
+            product_extraction.ProductExtractionInput(lines=[_line_to_parsed(ln) for ln in lines])
+        ),
+        product_extraction.ProductExtractionOutput,
+    )
+    for item in out.items:
+        if 0 <= item.index < len(lines):
+            result[lines[item.index].id] = item.products
+    return [ln for ln in lines if not result[ln.id]]
+
+
+async def _extract_single(ln: ListLine) -> list[product_extraction.ExtractedProduct]:
     try:
-        out = await client.structured(
-            product_extraction.render_batch(product_extraction.ProductExtractionInput(lines=parsed_lines)),
-            product_extraction.ProductExtractionOutput,
+        single = await deps.get_llm_client().structured(
+            product_extraction.render_single(_line_to_parsed(ln)),
+            product_extraction.ProductExtractionSingleOutput,
         )
-        for item in out.items:
-            if 0 <= item.index < len(lines):
-                result[lines[item.index].id] = item.products
-        # Fill any line the batch skipped via the single fallback.
-        missing = [ln for ln in lines if not result[ln.id]]
-    except LLMError as exc:
-        logger.info("batch product extraction failed, falling back per-item: %s", exc)
-        missing = list(lines)
+        return single.products or [
+            product_extraction.ExtractedProduct(search_term=ln.food, package_quantity=1, confidence=0.3)
+        ]
+    except LLMError:
+        # Never drop the line: search on the food name at low confidence.
+        return [product_extraction.ExtractedProduct(search_term=ln.food, package_quantity=1, confidence=0.2)]
+
+
+async def _extract_products(lines: list[ListLine]) -> dict[str, list[product_extraction.ExtractedProduct]]:
+    """P4 batch extraction with a per-item P4-single fallback (A.4).
 
-    for ln in missing:
+    Lines the batch skipped get one more (smaller) batch call before falling back
+    to P4-single, and the singles run concurrently rather than one round trip
+    after another.
+    """
+    result: dict[str, list[product_extraction.ExtractedProduct]] = {ln.id: [] for ln in lines}
+    missing = list(lines)
+    for _attempt in range(2):
+        if not missing:
+            break
         try:
-            single = await client.structured(
-                product_extraction.render_single(_line_to_parsed(ln)),
-                product_extraction.ProductExtractionSingleOutput,
-            )
-            result[ln.id] = single.products or [
-                product_extraction.ExtractedProduct(search_term=ln.food, package_quantity=1, confidence=0.3)
-            ]
-        except LLMError:
-            # Never drop the line: search on the food name at low confidence.
-            result[ln.id] = [
-                product_extraction.ExtractedProduct(search_term=ln.food, package_quantity=1, confidence=0.2)
-            ]
+            missing = await _extract_batch(missing, result)
+        except LLMError as exc:
+            logger.info("batch product extraction failed, falling back per-item: %s", exc)
+            break
+
+    if missing:
+        singles = await asyncio.gather(*(_extract_single(ln) for ln in missing))
+        for ln, products in zip(missing, singles, strict=True):
+            result[ln.id] = products
     return result
 
 
-async def _rank(term: str, target_size: str | None, package_qty: int, products: list[Product]) -> list[Product]:
-    """LLM-rank products (P5); returns products best-first, or [] if none acceptable."""
-    if not products:
-        return []
-    ranking_in = product_ranking.ProductRankingInput(
-        search_term=term,
-        target_size=target_size,
-        package_quantity=package_qty,
+def _ranking_input(item: MatchItem, products: list[Product]) -> product_ranking.ProductRankingInput:
+    return product_ranking.ProductRankingInput(
+        search_term=item.search_term,
+        target_size=item.target_size,
+        package_quantity=item.count,
         products=[
             product_ranking.RankableProduct(
                 description=p.description or "",
@@ -166,46 +188,119 @@ async def _rank(term: str, target_size: str | None, package_qty: int, products:
             for p in products
         ],
     )
+
+
+def _apply_ranking(out: product_ranking.ProductRankingOutput, products: list[Product]) -> list[Product]:
+    if out.none_acceptable or not out.ranked:
+        return []
+    ordered = [products[r.index] for r in out.ranked if 0 <= r.index < len(products)]
+    return ordered or products
+
+
+async def _rank(item: MatchItem, products: list[Product]) -> list[Product]:
+    """LLM-rank products (P5); returns products best-first, or [] if none acceptable."""
+    if not products:
+        return []
     try:
         out = await deps.get_llm_client().structured(
-            product_ranking.render(ranking_in), product_ranking.ProductRankingOutput
+            product_ranking.render(_ranking_input(item, products)), product_ranking.ProductRankingOutput
         )
     except LLMError as exc:
-        logger.info("product ranking failed for %r; using search order: %s", term, exc)
+        logger.info("product ranking failed for %r; using search order: %s", item.search_term, exc)
         return products
-    if out.none_acceptable or not out.ranked:
-        return []
-    ordered = [products[r.index] for r in out.ranked if 0 <= r.index < len(products)]
-    return ordered or products
+    return _apply_ranking(out, products)
 
 
-async def _match_one(
-    item: MatchItem,
-    location_id: str,
-    fulfillment: str | None,
-    *,
-    usuals: dict[str, list[ProductMemory]] | None = None,
-) -> MatchItem:
-    """Search + rank + substitute for one extracted product.
+async def _rank_batch(entries: list[tuple[MatchItem, list[Product]]]) -> dict[str, list[Product]]:
+    """P5 over several items in one call; maps item id -> best-first products.
 
-    When ``usuals`` is supplied and a remembered obtainable product is in the
-    results, take the short-circuit path (no P5 ranking). Otherwise fall through
-    to normal ranking + the A.8 substitution walk.
+    Items the batch skipped (or every item, if the call fails) are absent from
+    the result so the caller can fall back to the single P5 prompt.
     """
-    item.is_usual = False  # clear any stale flag on a re-match/manual search
+    if len(entries) < 2:
+        return {}
     try:
-        products = await deps.kroger_search_products(
+        out = await deps.get_llm_client().structured(
+            product_ranking.render_batch(
+                product_ranking.ProductRankingBatchInput(items=[_ranking_input(it, prods) for it, prods in entries])
+            ),
+            product_ranking.ProductRankingBatchOutput,
+        )
+    except LLMError as exc:
+        logger.info("batch product ranking failed, falling back per-item: %s", exc)
+        return {}
+    ranked: dict[str, list[Product]] = {}
+    for row in out.items:
+        if 0 <= row.index < len(entries):
+            item, products = entries[row.index]
+            ranked[item.id] = _apply_ranking(row, products)
+    return ranked
+
+
+async def _search(item: MatchItem, location_id: str, fulfillment: str | None) -> list[Product] | None:
+    """Kroger search for one extracted product; ``None`` (item marked failed) on error."""
+    try:
+        return await deps.kroger_search_products(
             None, item.search_term, location_id, limit=_SEARCH_LIMIT, fulfillment=fulfillment
         )
     except KrogerError as exc:
         item.status = ItemStatus.FAILED
         item.error = getattr(exc, "message", str(exc))
-        return item
+        return None
 
+
+async def _search_all(
+    items: list[MatchItem], location_id: str, fulfillment: str | None, sem: asyncio.Semaphore
+) -> list[list[Product] | None]:
+    """Search every item concurrently, one Kroger call per distinct search term.
+
+    Lines that extract to the same term (e.g. "salt" from two recipes) share the
+    lead item's result; each item is still ranked against its own target size.
+    A failed search marks every item in its group failed. Results line up with
+    ``items``.
+    """
+    groups: dict[str, list[MatchItem]] = {}
+    for item in items:
+        groups.setdefault(memory.food_key(item.search_term), []).append(item)
+
+    async def _one(group: list[MatchItem]) -> list[Product] | None:
+        lead = group[0]
+        async with sem:
+            try:
+                products = await _search(lead, location_id, fulfillment)
+            except KrogerNotConnectedError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - never let one item sink the run
+                logger.warning("match item %s search crashed: %s", lead.id, exc)
+                lead.status = ItemStatus.FAILED
+                lead.error = str(exc)
+                products = None
+        if products is None:
+            for other in group[1:]:
+                other.status, other.error = lead.status, lead.error
+        return products
+
+    results = await asyncio.gather(*(_one(group) for group in groups.values()))
+    by_term = dict(zip(groups, results, strict=True))
+    return [by_term[memory.food_key(item.search_term)] for item in items]
+
+
+async def _resolve(
+    item: MatchItem,
+    products: list[Product],
+    fulfillment: str | None,
+    *,
+    usuals: dict[str, list[ProductMemory]] | None = None,
+) -> MatchItem:
+    """Rank + substitute one item against its already-fetched search results."""
     if _usual_from_products(item, products, fulfillment, usuals):
         return item
 
-    ranked = await _rank(item.search_term, item.target_size, item.count, products)
+    return _select(item, await _rank(item, products), fulfillment)
+
+
+def _select(item: MatchItem, ranked: list[Product], fulfillment: str | None) -> MatchItem:
+    """Run the A.8 substitution walk over ``ranked`` and record the outcome."""
     if not ranked:
         item.status = ItemStatus.NOT_FOUND
         return item
@@ -220,6 +315,26 @@ async def _match_one(
     return item
 
 
+async def _match_one(
+    item: MatchItem,
+    location_id: str,
+    fulfillment: str | None,
+    *,
+    usuals: dict[str, list[ProductMemory]] | None = None,
+) -> MatchItem:
+    """Search + rank + substitute for one extracted product.
+
+    When ``usuals`` is supplied and a remembered obtainable product is in the
+    results, take the short-circuit path (no P5 ranking). Otherwise fall through
+    to normal ranking + the A.8 substitution walk.
+    """
+    item.is_usual = False  # clear any stale flag on a re-match/manual search
+    products = await _search(item, location_id, fulfillment)
+    if products is None:
+        return item
+    return await _resolve(item, products, fulfillment, usuals=usuals)
+
+
 def _estimated_total(items: list[MatchItem]) -> float:
     total = 0.0
     for it in items:
@@ -311,28 +426,68 @@ async def run_match(plan_id: str) -> None:
     write_lock = asyncio.Lock()
     sem = asyncio.Semaphore(_ITEM_CONCURRENCY)
 
-    async def _do(item: MatchItem) -> None:
-        async with sem:
-            try:
-                resolved = await _match_one(item, location_id, fulfillment, usuals=usuals)
-            except KrogerNotConnectedError:
-                raise
-            except Exception as exc:  # noqa: BLE001 - never let one item sink the run
-                logger.warning("match item %s crashed: %s", item.id, exc)
-                item.status = ItemStatus.FAILED
-                item.error = str(exc)
-                resolved = item
+    # Phase 1: every Kroger search up front, so the store API sees one bounded
+    # burst instead of searches interleaved with P5 waits.
+    searches = await _search_all(items, location_id, fulfillment, sem)
+
+    async def _persist(resolved: list[MatchItem]) -> None:
+        by_id = {it.id: it for it in resolved}
         async with write_lock, factory() as s:
             plan = await s.get(Plan, plan_id)
             if plan is None or plan.status == PlanStatus.ABANDONED:
                 return
             cart = CartState(**(plan.matches or {}))
-            cart.items = [resolved if it.id == resolved.id else it for it in cart.items]
+            cart.items = [by_id.get(it.id, it) for it in cart.items]
             cart.estimated_total = _estimated_total(cart.items)
             plan.matches = cart.model_dump(mode="json")
             await s.commit()
 
-    await asyncio.gather(*(_do(it) for it in items))
+    # Phase 2: failed searches, empty results and usual short-circuits resolve
+    # immediately; everything else is P5-ranked in batches (one call per batch,
+    # per-item P5 fallback) and persisted batch by batch.
+    settled: list[MatchItem] = []
+    to_rank: list[tuple[MatchItem, list[Product]]] = []
+    for item, products in zip(items, searches, strict=True):
+        if products is None:
+            settled.append(item)
+        elif not products:
+            item.status = ItemStatus.NOT_FOUND
+            settled.append(item)
+        elif _usual_from_products(item, products, fulfillment, usuals):
+            settled.append(item)
+        else:
+            to_rank.append((item, products))
+    if settled:
+        await _persist(settled)
+
+    async def _settle(item: MatchItem, products: list[Product], ranked: dict[str, list[Product]]) -> None:
+        try:
+            if item.id in ranked:
+                best = ranked[item.id]
+            else:
+                async with sem:
+                    best = await _rank(item, products)
+            _select(item, best, fulfillment)
+        except Exception as exc:  # noqa: BLE001 - never let one item sink the run
+            logger.warning("match item %s crashed: %s", item.id, exc)
+            item.status = ItemStatus.FAILED
+            item.error = str(exc)
+
+    async def _rank_chunk(chunk: list[tuple[MatchItem, list[Product]]]) -> None:
+        async with sem:
+            try:
+                ranked = await _rank_batch(chunk)
+            except Exception as exc:  # noqa: BLE001 - degrade to per-item ranking
+                logger.warning("batch ranking crashed: %s", exc)
+                ranked = {}
+        # The batch's slot is released first: items it missed fall back to the
+        # single P5 prompt concurrently, each under its own slot.
+        await asyncio.gather(*(_settle(item, products, ranked) for item, products in chunk))
+        await _persist([item for item, _ in chunk])
+
+    await asyncio.gather(
+        *(_rank_chunk(to_rank[i : i + _RANK_BATCH_SIZE]) for i in range(0, len(to_rank), _RANK_BATCH_SIZE))
+    )
 
     async with factory() as session:
         plan = await session.get(Plan, plan_id)
@@ -7,11 +7,16 @@ choices are loaded. A parse failure surfaces on that meal with the plan staying
 ``selecting`` so the user can retry. Once every meal is resolved (and at least one
 recipe is saved), the shopping list is built and the plan advances to
 ``reviewing_list``.
+
+Scrapes for all web choices in one request run concurrently up front (they need
+no session); the saves that follow share the request session and stay in order.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +29,7 @@ from remy_api.planner.schemas import (
     SelectionStatus,
 )
 from remy_api.recipes.llm_fallback import RecipeParseError
+from remy_api.recipes.schemas import ParsedRecipe
 
 logger = logging.getLogger("remy.planner.select")
 
@@ -38,9 +44,32 @@ def _find_candidate(plan: Plan, meal_id: str, candidate_id: str) -> Candidate |
     return None
 
 
-async def _save_web_recipe(session: AsyncSession, user_id: str, url: str) -> tuple[str, str]:
-    """Scrape ``url``, save to cookbook with image; return (recipe_id, title)."""
-    parsed = await deps.scrape_recipe(url, llm=deps.get_prompt_id_llm())
+def _scrape_url(plan: Plan, choice: MealChoice) -> str | None:
+    """The URL ``choice`` resolves to scraping, if any (mirrors ``_process_choice``)."""
+    if choice.choice == "skip":
+        return None
+    if choice.choice == "candidate" and choice.candidate_id:
+        cand = _find_candidate(plan, choice.meal_id, choice.candidate_id)
+        if cand is None or cand.saved_recipe_id:
+            return None
+        return cand.url
+    return choice.url
+
+
+async def _scrape_all(urls: list[str]) -> dict[str, ParsedRecipe | BaseException]:
+    """Scrape each distinct URL concurrently; failures are returned, not raised."""
+    unique = list(dict.fromkeys(urls))
+    llm = deps.get_prompt_id_llm()
+    results = await asyncio.gather(*(deps.scrape_recipe(url, llm=llm) for url in unique), return_exceptions=True)
+    return dict(zip(unique, results, strict=True))
+
+
+async def _save_web_recipe(
+    session: AsyncSession, user_id: str, url: str, parsed: ParsedRecipe | BaseException
+) -> tuple[str, str]:
+    """Save an already-scraped ``url`` to the cookbook with image; return (recipe_id, title)."""
+    if isinstance(parsed, BaseException):
+        raise parsed
     recipe = await deps.create_recipe(session, user_id, parsed)
     if parsed.image_url:
         stored = await deps.download_recipe_image(recipe.id, parsed.image_url)
@@ -51,7 +80,12 @@ async def _save_web_recipe(session: AsyncSession, user_id: str, url: str) -> tup
     return recipe.id, recipe.title
 
 
-async def _process_choice(session: AsyncSession, plan: Plan, choice: MealChoice) -> SelectionState:
+async def _process_choice(
+    session: AsyncSession,
+    plan: Plan,
+    choice: MealChoice,
+    scraped: dict[str, ParsedRecipe | BaseException],
+) -> SelectionState:
     sel = SelectionState(meal_id=choice.meal_id, choice=choice.choice)
     if choice.choice == "skip":
         sel.status = SelectionStatus.SKIPPED
@@ -78,7 +112,7 @@ async def _process_choice(session: AsyncSession, plan: Plan, choice: MealChoice)
             sel.recipe_id, sel.recipe_title = recipe.id, recipe.title
         elif url:
             sel.url = url
-            sel.recipe_id, sel.recipe_title = await _save_web_recipe(session, plan.user_id, url)
+            sel.recipe_id, sel.recipe_title = await _save_web_recipe(session, plan.user_id, url, scraped[url])
         else:
             sel.status = SelectionStatus.ERROR
             sel.error = "No candidate, URL, or skip provided."
@@ -100,19 +134,21 @@ async def _process_choice(session: AsyncSession, plan: Plan, choice: MealChoice)
 async def process_select(session: AsyncSession, plan: Plan, choices: list[MealChoice]) -> None:
     """Apply ``choices``, persist selections, and advance when fully resolved."""
     selections = dict(plan.selections or {})
+    scraped = await _scrape_all([url for choice in choices if (url := _scrape_url(plan, choice))])
     for choice in choices:
-        sel = await _process_choice(session, plan, choice)
+        sel = await _process_choice(session, plan, choice, scraped)
         selections[choice.meal_id] = sel.model_dump(mode="json")
     plan.selections = selections
 
     # Advance only when every meal is resolved (saved/skipped) with no errors,
     # and at least one recipe was actually saved.
     meal_ids = [m["id"] for m in (plan.meals or [])]
-    states = {mid: SelectionState(**selections[mid]) for mid in meal_ids if mid in selections}
-    all_resolved = len(states) == len(meal_ids) and all(
-        s.status in (SelectionStatus.SAVED, SelectionStatus.SKIPPED) for s in states.values()
-    )
-    any_saved = any(s.status == SelectionStatus.SAVED for s in states.values())
+    # One tally of selection statuses answers both questions in a single pass.
+    # The rows were just dumped by this step, so read them without re-validating.
+    counts = Counter(SelectionState.model_construct(**selections[mid]).status for mid in meal_ids if mid in selections)
+    saved = counts[SelectionStatus.SAVED]
+    all_resolved = saved + counts[SelectionStatus.SKIPPED] == len(meal_ids)
+    any_saved = saved > 0
 
     if all_resolved and any_saved:
         await listing.build_list(session, plan)
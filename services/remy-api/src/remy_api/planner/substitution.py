@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass
+from itertools import islice
 
 from remy_api.kroger.models import Product, StockLevel
 
@@ -27,7 +28,7 @@ class MatchStatus(enum.StrEnum):
 _CONFIRMED_STOCK = {StockLevel.HIGH, StockLevel.MEDIUM, StockLevel.LOW}
 
 
-@dataclass
+@dataclass(slots=True)
 class Selection:
     status: MatchStatus
     chosen: Product | None
@@ -83,5 +84,5 @@ def select_product(
         chosen = eligible[0]
         status = MatchStatus.STOCK_UNKNOWN if chosen is top else MatchStatus.SUBSTITUTED
 
-    alternatives = [p for p in eligible if p is not chosen][:3]
+    alternatives = list(islice((p for p in eligible if p is not chosen), 3))
     return Selection(status=status, chosen=chosen, alternatives=alternatives)
@@ -8,9 +8,8 @@ numbers-only, or fenced blobs (PRD §7.1, §9.3).
 
 from __future__ import annotations
 
-import json
-
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from remy_api.llm.prompt import RenderedPrompt
 
@@ -18,8 +17,14 @@ __all__ = ["RenderedPrompt", "json_block", "indexed"]
 
 
 def json_block(data: object) -> str:
-    """Compact, stable JSON for embedding inputs in a user message."""
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    """Compact, stable JSON for embedding inputs in a user message.
+
+    Serialized by pydantic-core (native, several times faster than ``json.dumps``
+    on the per-call ranking/extraction payloads); the output matches
+    ``json.dumps(indent=2, ensure_ascii=False)`` byte for byte apart from
+    exponent spelling on tiny floats (``1e-7`` vs ``1e-07``).
+    """
+    return to_json(data, indent=2).decode()
 
 
 def indexed(items: list[BaseModel] | list[dict] | list[str], key: str = "index") -> list[dict]:
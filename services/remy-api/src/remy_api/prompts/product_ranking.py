@@ -6,6 +6,10 @@ none_acceptable escape hatch. Fixes legacy "reply with only the number": returns
 structured indices, includes price for unit-price reasoning, and yields both the
 match and its alternatives in one call (cart review needs up to 3 alternatives).
 Deterministic stock/substitution logic runs on this output downstream (A.8).
+
+``render_batch`` ranks several independent terms in one call (the match step
+batches its cart this way); it shares the single prompt's rules block and falls
+back to per-term ``render`` for anything the batch skips.
 """
 
 from __future__ import annotations
@@ -15,7 +19,8 @@ from pydantic import BaseModel, Field
 from remy_api.prompts.base import RenderedPrompt, indexed, json_block
 
 PROMPT_ID = "product_ranking"
-VERSION = 2
+PROMPT_ID_BATCH = "product_ranking_batch"
+VERSION = 3
 
 
 class RankableProduct(BaseModel):
@@ -47,14 +52,45 @@ class ProductRankingOutput(BaseModel):
     )
 
 
-_SYSTEM = """\
+class ProductRankingBatchInput(BaseModel):
+    items: list[ProductRankingInput]
+
+
+class ProductRankingBatchItem(ProductRankingOutput):
+    # Required here (unlike the single output): with schema-constrained output
+    # and defaults in place, models answer a batch with bare ``{"index": n}``
+    # rows, which read as "no ranking" for every term.
+    index: int = Field(description="Index of the search term this ranking belongs to.")
+    ranked: list[RankedProduct] = Field(description="Best matches first, up to 4. Empty if none acceptable.")
+    none_acceptable: bool = Field(description="True when no product is a reasonable match (surface 'search manually').")
+
+
+class ProductRankingBatchOutput(BaseModel):
+    items: list[ProductRankingBatchItem]
+
+
+_INTRO = """\
 You rank grocery products for how well they match a shopping search term.
 Output MUST be JSON:
 {"ranked": [{"index": int, "reason": str}], "none_acceptable": bool}
 List the best matches first, at most 4 (a top pick + up to 3 alternatives).
 Only include genuinely plausible matches. If NONE are acceptable, return
 {"ranked": [], "none_acceptable": true}.
+"""
+
+_INTRO_BATCH = """\
+You rank grocery products for how well they match shopping search terms. Each
+input term is independent and carries its own indexed product list.
+Output MUST be JSON:
+{"items": [{"index": int, "ranked": [{"index": int, "reason": str}], "none_acceptable": bool}]}
+Return exactly one object per input term, echoing its `index`; `ranked[].index`
+refers to that term's own product list. Per term, list the best matches first, at
+most 4 (a top pick + up to 3 alternatives), and only genuinely plausible matches.
+If NONE are acceptable for a term, give it "ranked": [] and "none_acceptable": true.
+"""
 
+# One rules block shared by the single and batch prompts so they can never drift.
+_RULES = """\
 Ranking rules:
 - Pick the ACTUAL ingredient, not a prepared food, mix, or seasoning that merely
   contains it. Disambiguate by intent: "green onions" = fresh scallions, NOT
@@ -80,6 +116,9 @@ Ranking rules:
 - Give a short reason per ranked item (why it placed there / any caveat).
 """
 
+_SYSTEM = f"{_INTRO}\n{_RULES}"
+_SYSTEM_BATCH = f"{_INTRO_BATCH}\n{_RULES}"
+
 
 def render(data: ProductRankingInput) -> RenderedPrompt:
     rows = indexed(list(data.products))
@@ -88,3 +127,9 @@ def render(data: ProductRankingInput) -> RenderedPrompt:
         header += f"\nTarget size: {data.target_size}"
     user = f"{header}\n\nProducts (indexed):\n{json_block(rows)}"
     return RenderedPrompt(prompt_id=PROMPT_ID, version=VERSION, system=_SYSTEM, user=user, temperature=0.0)
+
+
+def render_batch(data: ProductRankingBatchInput) -> RenderedPrompt:
+    rows = [{**row, "products": indexed(row["products"])} for row in indexed(list(data.items))]
+    user = "Search terms with their products (indexed):\n" + json_block(rows)
+    return RenderedPrompt(prompt_id=PROMPT_ID_BATCH, version=VERSION, system=_SYSTEM_BATCH, user=user, temperature=0.0)
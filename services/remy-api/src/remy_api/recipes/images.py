@@ -8,6 +8,7 @@ the functions return ``None`` and the recipe simply has no image.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 from pathlib import Path
@@ -16,6 +17,7 @@ import httpx
 from PIL import Image, UnidentifiedImageError
 
 from remy_api.config import get_settings
+from remy_api.net import get_http_client
 
 logger = logging.getLogger("remy.recipes.images")
 
@@ -76,10 +78,9 @@ async def download_recipe_image(
     if not image_url:
         return None
     req_headers = {"User-Agent": _USER_AGENT, **(headers or {})}
-    owns_client = client is None
-    client = client or httpx.AsyncClient(timeout=_DOWNLOAD_TIMEOUT, follow_redirects=True)
+    client = client or get_http_client()
     try:
-        resp = await client.get(image_url, headers=req_headers)
+        resp = await client.get(image_url, headers=req_headers, timeout=_DOWNLOAD_TIMEOUT, follow_redirects=True)
         resp.raise_for_status()
         raw = resp.content[: _MAX_IMAGE_BYTES + 1]
         if len(raw) > _MAX_IMAGE_BYTES:
@@ -88,10 +89,7 @@ async def download_recipe_image(
     except httpx.HTTPError as exc:
         logger.info("Failed to download image for %s from %s: %s", recipe_id, image_url, exc)
         return None
-    finally:
-        if owns_client:
-            await client.aclose()
-    return store_image_bytes(recipe_id, raw)
+    return await asyncio.to_thread(store_image_bytes, recipe_id, raw)
 
 
 def delete_recipe_image(recipe_id: str) -> None:
@@ -3,6 +3,8 @@
 Pages through a Mealie instance's ``/api/recipes``, fetches each recipe detail,
 maps it into the Remy recipe store, and downloads the image. Idempotent by
 Mealie slug (``Recipe.mealie_slug``): a re-run skips recipes already imported.
+Detail fetches run concurrently a page at a time; store writes stay sequential
+on the one session.
 
 Field mapping note: Mealie *does* provide parsed ``{quantity, unit, food}`` per
 ingredient, but we intentionally store only the **raw line** and leave the parsed
@@ -14,6 +16,7 @@ Mealie API shapes referenced from ``legacy/services/mealie-mcp-server/src/mealie
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 
@@ -28,6 +31,7 @@ logger = logging.getLogger("remy.recipes.mealie_import")
 
 _PER_PAGE = 50
 _TIMEOUT = 30.0
+_DETAIL_CONCURRENCY = 8
 
 
 @dataclass
@@ -102,8 +106,12 @@ def map_recipe(detail: dict, base_url: str) -> tuple[ParsedRecipe, str, str | No
 
 
 async def _iter_recipe_slugs(client: httpx.AsyncClient) -> list[str]:
-    """Page through ``/api/recipes`` and return all recipe slugs."""
-    slugs: list[str] = []
+    """Page through ``/api/recipes`` and return all recipe slugs, each once.
+
+    Offset paging can hand back a slug twice when recipes are added mid-import;
+    a repeat would otherwise be fetched and created twice in the same run.
+    """
+    slugs: dict[str, None] = {}
     page = 1
     while True:
         resp = await client.get("/api/recipes", params={"page": page, "perPage": _PER_PAGE})
@@ -115,14 +123,43 @@ async def _iter_recipe_slugs(client: httpx.AsyncClient) -> list[str]:
         for item in items:
             slug = item.get("slug")
             if slug:
-                slugs.append(slug)
+                slugs[slug] = None
         total_pages = body.get("total_pages") or body.get("totalPages")
         if total_pages is not None and page >= int(total_pages):
             break
         if len(items) < _PER_PAGE:
             break
         page += 1
-    return slugs
+    return list(slugs)
+
+
+async def _fetch_details(
+    client: httpx.AsyncClient, slugs: list[str], base_url: str
+) -> list[tuple[ParsedRecipe, str, str | None] | Exception]:
+    """Fetch and map recipe details concurrently; each slot is the mapping or its error.
+
+    Mapping happens as each payload arrives, so the raw detail (nutrition,
+    settings, comments, ...) is dropped right away instead of a page of it
+    sitting in memory until the sequential store writes reach it.
+    """
+    sem = asyncio.Semaphore(_DETAIL_CONCURRENCY)
+
+    async def _one(slug: str) -> tuple[ParsedRecipe, str, str | None]:
+        async with sem:
+            resp = await client.get(f"/api/recipes/{slug}")
+            resp.raise_for_status()
+            return map_recipe(resp.json(), base_url)
+
+    return await asyncio.gather(*(_one(slug) for slug in slugs), return_exceptions=True)
+
+
+def _record_failure(stats: ImportStats, slug: str, exc: Exception) -> None:
+    stats.failed += 1
+    stats.errors.append(f"{slug}: {exc}")
+    if isinstance(exc, httpx.HTTPError):
+        logger.warning("Failed to import Mealie recipe %s: %s", slug, exc)
+    else:
+        logger.warning("Unexpected error importing %s: %s", slug, exc)
 
 
 async def import_mealie(
@@ -147,35 +184,42 @@ async def import_mealie(
     try:
         slugs = await _iter_recipe_slugs(client)
         logger.info("Mealie reports %d recipes", len(slugs))
+        pending: list[str] = []
         for slug in slugs:
             try:
                 existing = await find_by_mealie_slug(session, user_id, slug)
-                if existing is not None:
-                    stats.skipped += 1
+            except Exception as exc:  # noqa: BLE001 - keep importing the rest
+                _record_failure(stats, slug, exc)
+                continue
+            if existing is not None:
+                stats.skipped += 1
+            else:
+                pending.append(slug)
+
+        for start in range(0, len(pending), _PER_PAGE):
+            chunk = pending[start : start + _PER_PAGE]
+            mapped = await _fetch_details(client, chunk, base_url)
+            for slug, result in zip(chunk, mapped, strict=True):
+                if isinstance(result, Exception):
+                    _record_failure(stats, slug, result)
                     continue
-                resp = await client.get(f"/api/recipes/{slug}")
-                resp.raise_for_status()
-                detail = resp.json()
-                parsed, mslug, image_url = map_recipe(detail, base_url)
-                if dry_run:
+                parsed, mslug, image_url = result
+                try:
+                    if dry_run:
+                        stats.imported += 1
+                        logger.info(
+                            "[dry-run] would import '%s' (%d ingredients)", parsed.title, len(parsed.ingredients)
+                        )
+                        continue
+                    recipe = await create_recipe(session, user_id, parsed, mealie_slug=mslug or slug)
+                    if image_url:
+                        stored = await download_recipe_image(recipe.id, image_url, client=client, headers=auth_headers)
+                        if stored:
+                            recipe.image_path = stored
+                            await session.commit()
                     stats.imported += 1
-                    logger.info("[dry-run] would import '%s' (%d ingredients)", parsed.title, len(parsed.ingredients))
-                    continue
-                recipe = await create_recipe(session, user_id, parsed, mealie_slug=mslug or slug)
-                if image_url:
-                    stored = await download_recipe_image(recipe.id, image_url, client=client, headers=auth_headers)
-                    if stored:
-                        recipe.image_path = stored
-                        await session.commit()
-                stats.imported += 1
-            except httpx.HTTPError as exc:
-                stats.failed += 1
-                stats.errors.append(f"{slug}: {exc}")
-                logger.warning("Failed to import Mealie recipe %s: %s", slug, exc)
-            except Exception as exc:  # noqa: BLE001 - keep importing the rest
-                stats.failed += 1
-                stats.errors.append(f"{slug}: {exc}")
-                logger.warning("Unexpected error importing %s: %s", slug, exc)
+                except Exception as exc:  # noqa: BLE001 - keep importing the rest
+                    _record_failure(stats, slug, exc)
     finally:
         if owns_client:
             await client.aclose()
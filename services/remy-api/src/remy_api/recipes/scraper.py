@@ -13,13 +13,14 @@ Pipeline
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import httpx
 from bs4 import BeautifulSoup
 from recipe_scrapers import scrape_html
 
-from remy_api.net import BLOCKED_STATUSES, impersonated_get
+from remy_api.net import BLOCKED_STATUSES, get_http_client, impersonated_get
 from remy_api.recipes.llm_fallback import RecipeParseError, StructuredLLM, llm_extract_recipe
 from remy_api.recipes.schemas import ParsedIngredient, ParsedRecipe
 
@@ -39,10 +40,9 @@ async def fetch_page(url: str, *, client: httpx.AsyncClient | None = None) -> st
     non-2xx status, or a transport error all become a typed parse error.
     """
     headers = {"User-Agent": _USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
-    owns_client = client is None
-    client = client or httpx.AsyncClient(timeout=_FETCH_TIMEOUT, follow_redirects=True, headers=headers)
+    client = client or get_http_client()
     try:
-        resp = await client.get(url, headers=headers)
+        resp = await client.get(url, headers=headers, timeout=_FETCH_TIMEOUT, follow_redirects=True)
         # Bot walls (e.g. seriouseats) 403 plain httpx despite the browser UA —
         # they fingerprint the TLS handshake. Retry once via curl_cffi
         # impersonation before giving up (PRD §9.1: no silent failure).
@@ -66,9 +66,6 @@ async def fetch_page(url: str, *, client: httpx.AsyncClient | None = None) -> st
             "Could not fetch the recipe page.",
             reasons=["fetch_failed"],
         ) from exc
-    finally:
-        if owns_client:
-            await client.aclose()
 
 
 async def _fetch_page_impersonated(url: str, headers: dict[str, str]) -> str:
@@ -177,10 +174,13 @@ async def scrape_recipe(
     """
     html = await fetch_page(url, client=client)
 
+    # recipe-scrapers/BeautifulSoup parsing is synchronous and CPU-bound (tens to
+    # hundreds of ms on large pages); run it in a worker thread so concurrent
+    # plan steps keep the event loop.
     scraper_reasons: list[str] = []
     parsed: ParsedRecipe | None = None
     try:
-        parsed = parse_with_scrapers(html, url)
+        parsed = await asyncio.to_thread(parse_with_scrapers, html, url)
     except Exception as exc:  # noqa: BLE001 - library can raise on malformed pages
         logger.info("recipe-scrapers failed for %s: %s", url, exc)
         scraper_reasons.append("scraper_error")
@@ -199,7 +199,7 @@ async def scrape_recipe(
             reasons=[*scraper_reasons, "llm_unavailable"],
         )
 
-    page_text = extract_page_text(html)
+    page_text = await asyncio.to_thread(extract_page_text, html)
     if not page_text:
         raise RecipeParseError(
             "The recipe page had no readable text to extract.",
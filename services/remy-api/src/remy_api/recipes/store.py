@@ -23,6 +23,7 @@ gracefully to an ``ILIKE`` scan over title + ingredient foods.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import unicodedata
@@ -40,13 +41,16 @@ logger = logging.getLogger("remy.recipes.store")
 # Cached FTS5-availability probe result (None = not yet probed).
 _fts_available: bool | None = None
 
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+_WORD = re.compile(r"\w+")
+
 
 # --- slug helpers ------------------------------------------------------------
 
 
 def _slugify(title: str) -> str:
     normalized = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
-    slug = re.sub(r"[^a-z0-9]+", "-", normalized.lower()).strip("-")
+    slug = _NON_SLUG.sub("-", normalized.lower()).strip("-")
     return slug or "recipe"
 
 
@@ -118,7 +122,7 @@ def _fts_match_query(query: str) -> str:
     makes each a prefix match so "chick" finds "chicken". OR-joining favors
     recall — bm25 ranking still surfaces the strongest matches first.
     """
-    tokens = re.findall(r"\w+", query.lower())
+    tokens = _WORD.findall(query.lower())
     if not tokens:
         return ""
     return " OR ".join(f'"{tok}"*' for tok in tokens)
@@ -290,7 +294,7 @@ async def delete_recipe(session: AsyncSession, user_id: str, recipe_id: str) ->
     await _delete_fts(session, recipe_id)
     await session.delete(recipe)
     await session.commit()
-    delete_recipe_image(recipe_id)
+    await asyncio.to_thread(delete_recipe_image, recipe_id)
 
 
 async def find_by_mealie_slug(session: AsyncSession, user_id: str, mealie_slug: str) -> Recipe | None:
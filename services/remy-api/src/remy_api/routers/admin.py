@@ -9,6 +9,7 @@ returned exactly once, mirroring the API-token show-once contract.
 
 from __future__ import annotations
 
+import asyncio
 import secrets
 from datetime import UTC, datetime, timedelta
 
@@ -92,7 +93,7 @@ async def create_user_endpoint(payload: AdminUserCreate, _admin: AdminUser, sess
 async def reset_password(user_id: str, _admin: AdminUser, session: SessionDep) -> TempPasswordResponse:
     user = await _load_user(session, user_id)
     temp_password = _temp_password()
-    user.password_hash = hash_password(temp_password)
+    user.password_hash = await asyncio.to_thread(hash_password, temp_password)
     user.auth_version += 1
     await session.commit()
     return TempPasswordResponse(temp_password=temp_password)
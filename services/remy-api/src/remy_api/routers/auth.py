@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, status
@@ -26,7 +27,8 @@ async def login(
     row = await session.execute(select(User).where(User.username == payload.username))
     user = row.scalar_one_or_none()
     # Uniform error + always run the hash verify path to avoid user enumeration.
-    if user is None or not verify_password(payload.password, user.password_hash):
+    # argon2 is deliberately slow; verify in a worker thread so logins don't stall the loop.
+    if user is None or not await asyncio.to_thread(verify_password, payload.password, user.password_hash):
         raise AuthenticationError("Invalid username or password.")
     if not user.is_active:
         raise AuthenticationError("Account is disabled.")
@@ -62,7 +64,8 @@ async def register_with_invitation(
 
     # The same DB transaction includes consuming the invite and creating the
     # account. Any duplicate-user failure rolls back the consumption as well.
+    # create_user already refreshed the row after its flush, and commits don't
+    # expire attributes here, so the profile is built without another SELECT.
     user = await create_user(session, payload.username, payload.password, commit=False)
     await session.commit()
-    await session.refresh(user)
     return UserProfile.model_validate(user)
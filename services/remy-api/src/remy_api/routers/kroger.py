@@ -139,13 +139,14 @@ async def kroger_callback(
 
 @router.get("/status", response_model=StatusResponse)
 async def kroger_status(user: CurrentUser, session: SessionDep) -> StatusResponse:
-    row = await session.execute(select(KrogerToken).where(KrogerToken.user_id == user.id))
-    token = row.scalar_one_or_none()
-    if token is None:
+    # Only the expiry is needed; skip loading the encrypted token columns.
+    row = await session.execute(select(KrogerToken.expires_at).where(KrogerToken.user_id == user.id))
+    expires_at = row.scalar_one_or_none()
+    if expires_at is None:
         return StatusResponse(connected=False)
     from remy_api.kroger.service import _is_expired  # local import: internal helper
 
-    return StatusResponse(connected=True, expires_at=token.expires_at, expired=_is_expired(token, skew=0))
+    return StatusResponse(connected=True, expires_at=expires_at, expired=_is_expired(expires_at, skew=0))
 
 
 @router.delete("/disconnect", status_code=status.HTTP_204_NO_CONTENT)
@@ -8,8 +8,11 @@ hotlinked, PRD §5).
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, File, Form, Query, UploadFile, status
 from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 
 from remy_api.deps import CurrentUser, SessionDep
 from remy_api.errors import NotFoundError
@@ -34,6 +37,9 @@ from remy_api.recipes.scraper import scrape_recipe
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
+# One core-side validation for a recipe's whole ingredient list.
+_INGREDIENTS = TypeAdapter(list[IngredientOut])
+
 
 def _image_url(recipe: Recipe) -> str | None:
     return f"/recipes/{recipe.id}/image" if recipe.image_path else None
@@ -66,7 +72,7 @@ def _to_detail(recipe: Recipe) -> RecipeDetail:
         prep_time=recipe.prep_time,
         cook_time=recipe.cook_time,
         instructions=list(recipe.instructions or []),
-        ingredients=[IngredientOut.model_validate(i) for i in recipe.ingredients],
+        ingredients=_INGREDIENTS.validate_python(recipe.ingredients, from_attributes=True),
     )
 
 
@@ -130,7 +136,8 @@ async def create_recipe_from_upload(
     uploads = [
         RawUpload(filename=f.filename or "upload", content_type=f.content_type, data=await f.read()) for f in files
     ]
-    extraction = build_extraction(uploads)
+    # PDF rendering and image re-encoding are CPU-bound; keep them off the event loop.
+    extraction = await asyncio.to_thread(build_extraction, uploads)
 
     if extraction.mode == "text":
         rendered = recipe_extraction.render(
@@ -145,7 +152,7 @@ async def create_recipe_from_upload(
 
     recipe = await store.create_recipe(session, user.id, parsed)
     if extraction.cover_jpeg:
-        stored = store_image_bytes(recipe.id, extraction.cover_jpeg)
+        stored = await asyncio.to_thread(store_image_bytes, recipe.id, extraction.cover_jpeg)
         if stored:
             recipe.image_path = stored
             await session.commit()
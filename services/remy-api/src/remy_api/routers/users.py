@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, status
@@ -70,9 +71,9 @@ async def change_password(payload: PasswordChange, user: CurrentUser, session: S
     just failed the re-auth challenge. A 401 here would trip the web client's
     global logout-on-401 and bounce the user to the login screen.
     """
-    if not verify_password(payload.current_password, user.password_hash):
+    if not await asyncio.to_thread(verify_password, payload.current_password, user.password_hash):
         raise PermissionError_("Current password is incorrect.", code="invalid_current_password")
-    user.password_hash = hash_password(payload.new_password)
+    user.password_hash = await asyncio.to_thread(hash_password, payload.new_password)
     user.auth_version += 1
     await session.commit()
 
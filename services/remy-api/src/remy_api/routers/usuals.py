@@ -219,7 +219,7 @@ async def import_usuals(
             RawUpload(filename=f.filename or "upload", content_type=f.content_type, data=await f.read())
             for f in real_files
         ]
-        extraction = build_extraction(uploads)  # raises UploadRejectedError (422) on bad files
+        extraction = await asyncio.to_thread(build_extraction, uploads)  # raises UploadRejectedError (422) on bad files
         if extraction.mode == "text":
             prompt_in = receipt_items.ReceiptItemsInput(text=extraction.text or "")
         else:
@@ -10,6 +10,7 @@ import logging
 
 import httpx
 
+from remy_api.net import get_http_client
 from remy_api.search.base import (
     SearchConfigError,
     SearchProviderError,
@@ -67,8 +68,9 @@ class BraveSearchProvider:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(_BRAVE_ENDPOINT, params=params, headers=headers)
+            response = await get_http_client().get(
+                _BRAVE_ENDPOINT, params=params, headers=headers, timeout=self._timeout
+            )
         except httpx.TimeoutException as exc:
             raise SearchTimeoutError(f"Brave search timed out after {self._timeout}s") from exc
         except httpx.HTTPError as exc:
@@ -13,7 +13,6 @@ degrading. If you are not on one of those providers, use ``SEARCH_PROVIDER=brave
 
 from __future__ import annotations
 
-import json
 import logging
 
 import litellm
@@ -131,9 +130,12 @@ class LLMSearchProvider:
             content = response.choices[0].message.content or ""
         except (AttributeError, IndexError) as exc:
             raise SearchProviderError("LLM search returned no content") from exc
+        if not content.strip():
+            # Nothing to parse; skip validation.
+            raise SearchProviderError("LLM search returned no content")
 
         try:
-            envelope = _ResultsEnvelope.model_validate(json.loads(content))
+            envelope = _ResultsEnvelope.model_validate_json(content)
         except (ValueError, TypeError) as exc:
             raise SearchProviderError(f"LLM search returned unparseable results: {exc}") from exc
 
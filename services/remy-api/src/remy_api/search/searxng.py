@@ -16,6 +16,7 @@ import logging
 
 import httpx
 
+from remy_api.net import get_http_client
 from remy_api.search.base import (
     SearchConfigError,
     SearchProviderError,
@@ -65,8 +66,7 @@ class SearxngSearchProvider:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(f"{self._base_url}/search", params=params)
+            response = await get_http_client().get(f"{self._base_url}/search", params=params, timeout=self._timeout)
         except httpx.TimeoutException as exc:
             raise SearchTimeoutError(f"SearXNG search timed out after {self._timeout}s") from exc
         except httpx.HTTPError as exc:
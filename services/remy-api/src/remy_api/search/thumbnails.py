@@ -16,7 +16,7 @@ import logging
 import httpx
 from selectolax.parser import HTMLParser
 
-from remy_api.net import BLOCKED_STATUSES, impersonated_get
+from remy_api.net import BLOCKED_STATUSES, get_http_client, impersonated_get
 from remy_api.recipes.images import download_recipe_image, image_path_for
 
 logger = logging.getLogger(__name__)
@@ -78,10 +78,9 @@ async def fetch_og_image(
 
     Never raises: any network/parse failure yields ``None``.
     """
-    owns_client = client is None
-    client = client or httpx.AsyncClient(follow_redirects=True, timeout=timeout, headers=_HEADERS)
+    client = client or get_http_client()
     try:
-        async with client.stream("GET", url, headers=_HEADERS) as response:
+        async with client.stream("GET", url, headers=_HEADERS, timeout=timeout, follow_redirects=True) as response:
             # Bot-walled hosts 403 plain httpx despite the browser UA (TLS
             # fingerprinting). Retry via curl_cffi impersonation; still cosmetic,
             # so any failure there falls through to None.
@@ -104,9 +103,6 @@ async def fetch_og_image(
     except Exception as exc:  # noqa: BLE001 - cosmetic; log at debug and move on
         logger.debug("og:image fetch failed for %s: %s", url, exc)
         return None
-    finally:
-        if owns_client:
-            await client.aclose()
 
 
 async def _fetch_og_image_impersonated(url: str, timeout: float) -> str | None:
@@ -136,14 +132,11 @@ async def fetch_thumbnails(urls: list[str], concurrency: int = _CONCURRENCY) ->
 
     sem = asyncio.Semaphore(concurrency)
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=_TIMEOUT, headers=_HEADERS) as client:
-
-        async def _one(u: str) -> tuple[str, str | None]:
-            async with sem:
-                return u, await fetch_og_image(u, client=client)
-
-        pairs = await asyncio.gather(*(_one(u) for u in unique))
+    async def _one(u: str) -> tuple[str, str | None]:
+        async with sem:
+            return u, await fetch_og_image(u)
 
+    pairs = await asyncio.gather(*(_one(u) for u in unique))
     return dict(pairs)
 
 
@@ -173,19 +166,16 @@ async def cache_thumbnail_images(image_urls: list[str], concurrency: int = _CONC
         return {}
 
     sem = asyncio.Semaphore(concurrency)
-    async with httpx.AsyncClient(follow_redirects=True, timeout=_TIMEOUT) as client:
-
-        async def _one(url: str) -> tuple[str, str | None]:
-            cache_key = thumbnail_cache_key(url)
-            dest = thumbnail_cache_path(cache_key)
-            if not dest.is_file():
-                async with sem:
-                    stored = await download_recipe_image(
-                        f"{_CACHE_PREFIX}{cache_key}", url, client=client, headers=_HEADERS
-                    )
-                if stored is None:
-                    return url, None
-            return url, f"{_CACHE_ROUTE}/{cache_key}"
-
-        pairs = await asyncio.gather(*(_one(url) for url in unique))
+
+    async def _one(url: str) -> tuple[str, str | None]:
+        cache_key = thumbnail_cache_key(url)
+        dest = thumbnail_cache_path(cache_key)
+        if not dest.is_file():
+            async with sem:
+                stored = await download_recipe_image(f"{_CACHE_PREFIX}{cache_key}", url, headers=_HEADERS)
+            if stored is None:
+                return url, None
+        return url, f"{_CACHE_ROUTE}/{cache_key}"
+
+    pairs = await asyncio.gather(*(_one(url) for url in unique))
     return dict(pairs)
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import hashlib
 import secrets
-from datetime import UTC, datetime, timedelta
+import time
+from collections import OrderedDict
 
 import jwt
 from argon2 import PasswordHasher
@@ -23,6 +24,12 @@ from remy_api.errors import AuthenticationError
 API_TOKEN_PREFIX = "remy_"
 _ph = PasswordHasher()
 
+_DECODED_CACHE_SIZE = 1024
+# Verified claims per token: (exp, sub, auth_version). A token's claims are fixed
+# once signed, so a hit only rechecks expiry; the user row (auth_version,
+# is_active) is still loaded per request, so sign-out and disable stay immediate.
+_decoded: OrderedDict[str, tuple[int, str, int]] = OrderedDict()
+
 
 # --- Passwords ---------------------------------------------------------------
 
@@ -45,18 +52,23 @@ def verify_password(password: str, password_hash: str) -> bool:
 
 def create_access_token(user_id: str, auth_version: int = 0) -> str:
     settings = get_settings()
-    now = datetime.now(UTC)
+    now = int(time.time())  # RFC 7519 NumericDate: whole seconds since the epoch
     payload = {
         "sub": user_id,
         "av": auth_version,
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(hours=settings.jwt_expire_hours)).timestamp()),
+        "iat": now,
+        "exp": now + settings.jwt_expire_hours * 3600,
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
 def decode_access_token(token: str) -> tuple[str, int]:
     """Return the user id and session version from a valid token, else raise 401."""
+    hit = _decoded.get(token)
+    if hit is not None and hit[0] > time.time():
+        _decoded.move_to_end(token)
+        return hit[1], hit[2]
+
     settings = get_settings()
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
@@ -68,6 +80,12 @@ def decode_access_token(token: str) -> tuple[str, int]:
     auth_version = payload.get("av", 0)
     if not sub or not isinstance(auth_version, int):
         raise AuthenticationError("Invalid authentication token.")
+    exp = payload.get("exp")
+    if isinstance(exp, int):
+        _decoded[token] = (exp, str(sub), auth_version)
+        _decoded.move_to_end(token)
+        if len(_decoded) > _DECODED_CACHE_SIZE:
+            _decoded.popitem(last=False)
     return str(sub), auth_version
 
 
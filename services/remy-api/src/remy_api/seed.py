@@ -5,6 +5,9 @@ their favorite recipe sites from ``recipe_sources.yaml`` (``favorite_sources``
 domains). Path resolution walks up from this module to find the repo root; the
 files may also be overridden via ``PANTRY_FILE`` / ``RECIPE_SOURCES_FILE`` env
 vars (used by the Docker image, where the YAMLs are copied next to the source).
+
+Parsed results are cached per ``(path, mtime)``, so repeat calls skip the disk
+read and YAML parse while an edited file is still picked up on the next call.
 """
 
 from __future__ import annotations
@@ -15,6 +18,9 @@ from pathlib import Path
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it; same safe subset, much faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 PANTRY_FILENAME = "pantry.yaml"
 RECIPE_SOURCES_FILENAME = "recipe_sources.yaml"
 
@@ -35,13 +41,20 @@ def _resolve(env_var: str, filename: str) -> Path | None:
     return _find_upwards(filename)
 
 
-@lru_cache
-def default_pantry_items() -> list[str]:
-    """Ordered, de-duplicated pantry staples from ``pantry.yaml``."""
-    path = _resolve("PANTRY_FILE", PANTRY_FILENAME)
-    if path is None:
-        return []
-    data = yaml.safe_load(path.read_text()) or {}
+def _load_yaml(path: Path) -> dict:
+    return yaml.load(path.read_text(), Loader=_YAML_LOADER) or {}
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+@lru_cache(maxsize=8)
+def _pantry_items(path: Path, mtime: float) -> tuple[str, ...]:
+    data = _load_yaml(path)
     items = data.get("bypass_staples") or []
     seen: set[str] = set()
     result: list[str] = []
@@ -51,20 +64,32 @@ def default_pantry_items() -> list[str]:
         if normalized and key not in seen:
             seen.add(key)
             result.append(normalized)
-    return result
+    return tuple(result)
 
 
-@lru_cache
-def default_favorite_sites() -> list[str]:
-    """Favorite recipe-site domains from ``recipe_sources.yaml``."""
-    path = _resolve("RECIPE_SOURCES_FILE", RECIPE_SOURCES_FILENAME)
-    if path is None:
-        return []
-    data = yaml.safe_load(path.read_text()) or {}
+@lru_cache(maxsize=8)
+def _favorite_sites(path: Path, mtime: float) -> tuple[str, ...]:
+    data = _load_yaml(path)
     sources = data.get("favorite_sources") or []
     domains: list[str] = []
     for source in sources:
         domain = (source or {}).get("domain") if isinstance(source, dict) else None
         if domain:
             domains.append(str(domain).strip())
-    return domains
+    return tuple(domains)
+
+
+def default_pantry_items() -> list[str]:
+    """Ordered, de-duplicated pantry staples from ``pantry.yaml``."""
+    path = _resolve("PANTRY_FILE", PANTRY_FILENAME)
+    if path is None:
+        return []
+    return list(_pantry_items(path, _mtime(path)))
+
+
+def default_favorite_sites() -> list[str]:
+    """Favorite recipe-site domains from ``recipe_sources.yaml``."""
+    path = _resolve("RECIPE_SOURCES_FILE", RECIPE_SOURCES_FILENAME)
+    if path is None:
+        return []
+    return list(_favorite_sites(path, _mtime(path)))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,7 +26,9 @@ async def create_user(
     if existing.scalar_one_or_none() is not None:
         raise ConflictError(f"User '{username}' already exists.", code="user_exists")
 
-    user = User(username=username, password_hash=hash_password(password), is_admin=is_admin)
+    # argon2 hashing is deliberately slow; keep it off the event loop.
+    password_hash = await asyncio.to_thread(hash_password, password)
+    user = User(username=username, password_hash=password_hash, is_admin=is_admin)
     user.settings = UserSettings(
         pantry_items=default_pantry_items(),
         favorite_sites=default_favorite_sites(),
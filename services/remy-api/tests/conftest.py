@@ -7,7 +7,9 @@ are throwaway test values, never real credentials.
 """
 
 import os
+import shutil
 import tempfile
+from pathlib import Path
 
 from cryptography.fernet import Fernet
 
@@ -36,6 +38,45 @@ from remy_api.db import Base, get_engine, get_session_factory  # noqa: E402
 from remy_api.main import app  # noqa: E402
 
 
+def pytest_sessionfinish(session, exitstatus) -> None:  # noqa: ANN001
+    """Remove the session's throwaway DB (with its WAL sidecars) and image dir."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(_DB_PATH + suffix).unlink(missing_ok=True)
+    shutil.rmtree(_IMAGES_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cheap_password_hashing():
+    """Hash with argon2's cheapest profile for the whole session.
+
+    The production parameters cost ~200 ms per hash by design, and nearly every
+    API test creates a user and logs in. Verification reads the parameters from
+    the stored hash, so the auth paths under test are unchanged.
+    """
+    from argon2 import PasswordHasher, profiles
+
+    from remy_api import security
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "_ph", PasswordHasher.from_parameters(profiles.CHEAPEST))
+        yield
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _fresh_http_client():
+    """Drop the pooled outbound client and cached Kroger searches after each test.
+
+    Tests patch ``httpx.AsyncClient`` with a mock transport; a pooled client
+    surviving from an earlier test would bypass the patch (and its event loop).
+    """
+    from remy_api.kroger import clear_search_cache
+    from remy_api.net import close_http_client
+
+    yield
+    await close_http_client()
+    clear_search_cache()
+
+
 @pytest.fixture
 def db_path() -> str:
     return _DB_PATH
@@ -46,7 +87,18 @@ def images_dir() -> str:
     return _IMAGES_DIR
 
 
+_schema_created = False
+
+
 async def _reset_schema() -> None:
+    """Empty every table, creating the schema on first use.
+
+    The DDL runs once per session; later tests just delete rows (children
+    first), which is far cheaper than dropping and recreating every table.
+    ``store._fts_available`` is cleared here for every DB-backed test, so test
+    modules need no FTS fixture of their own.
+    """
+    global _schema_created
     from sqlalchemy import text
 
     from remy_api.rate_limit import reset_rate_limits
@@ -54,11 +106,20 @@ async def _reset_schema() -> None:
 
     engine = get_engine()
     async with engine.begin() as conn:
-        # recipe_fts is a raw FTS5 virtual table (not in Base.metadata), so it must
-        # be dropped explicitly or stale rows leak across tests and skew search.
-        await conn.execute(text("DROP TABLE IF EXISTS recipe_fts"))
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        if _schema_created:
+            for table in reversed(Base.metadata.sorted_tables):
+                await conn.execute(table.delete())
+            # recipe_fts is a raw FTS5 virtual table (not in Base.metadata), so it
+            # must be emptied explicitly or stale rows leak across tests and skew
+            # search. It is created lazily, so it may not exist yet.
+            fts = await conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'recipe_fts'"))
+            if fts.first() is not None:
+                await conn.execute(text("DELETE FROM recipe_fts"))
+        else:
+            await conn.execute(text("DROP TABLE IF EXISTS recipe_fts"))
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            _schema_created = True
     _store._fts_available = None
     reset_rate_limits()
 
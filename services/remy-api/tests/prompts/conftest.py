@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -48,9 +49,14 @@ def llm_key_present() -> bool:
     return any(os.environ.get(k) for k in keys)
 
 
+@lru_cache
+def _read_fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
 def load_fixture(name: str) -> dict:
-    with open(FIXTURES_DIR / name, encoding="utf-8") as fh:
-        return json.load(fh)
+    """Parse a fixture file, read from disk once per session (fresh dict per call)."""
+    return json.loads(_read_fixture(name))
 
 
 def pytest_collection_modifyitems(config, items):
@@ -282,6 +282,56 @@ async def test_p5_picks_fresh_produce_over_cans(llm_client):
     assert "Sliced" not in top and "Cups" not in top, top
 
 
+# --- P5 batch ranking (the match step's main path) ----------------------------
+
+
+def _ranking_input(case: dict) -> product_ranking.ProductRankingInput:
+    return product_ranking.ProductRankingInput(
+        search_term=case["search_term"],
+        package_quantity=case["package_quantity"],
+        products=[product_ranking.RankableProduct(**p) for p in case["products"]],
+    )
+
+
+async def _rank_batch_cases(llm_client, case_ids: list[int]) -> list[product_ranking.ProductRankingBatchItem]:
+    """Rank fixture cases in one batch call; returns rows in input order.
+
+    Every input term must come back exactly once — a skipped or duplicated
+    index silently costs (or double-counts) a per-item fallback in matching.
+    """
+    cases = load_fixture("kroger_products.json")["cases"]
+    out = await llm_client.structured(
+        product_ranking.render_batch(
+            product_ranking.ProductRankingBatchInput(items=[_ranking_input(cases[i]) for i in case_ids])
+        ),
+        product_ranking.ProductRankingBatchOutput,
+    )
+    indices = [row.index for row in out.items]
+    assert sorted(indices) == list(range(len(case_ids))), indices
+    return sorted(out.items, key=lambda row: row.index)
+
+
+async def test_p5_batch_avoids_multipack_when_qty_one(llm_client):
+    beans, _thighs = await _rank_batch_cases(llm_client, [0, 3])  # canned black beans + chicken thighs
+    products = load_fixture("kroger_products.json")["cases"][0]["products"]
+    assert beans.ranked, "expected at least one ranked product"
+    top = products[beans.ranked[0].index]["description"]
+    assert "8-Pack" not in top and "Value" not in top
+
+
+async def test_p5_batch_none_acceptable_is_per_term(llm_client):
+    saffron, onions = await _rank_batch_cases(llm_client, [4, 1])  # saffron -> nothing acceptable
+    assert saffron.none_acceptable is True
+    # The escape hatch must not bleed into the other term in the same batch.
+    assert onions.none_acceptable is False and onions.ranked
+
+
+async def test_p5_batch_all_canned_produce_is_none_acceptable(llm_client):
+    carrots, mint = await _rank_batch_cases(llm_client, [5, 2])  # fresh carrots -> all canned
+    assert carrots.none_acceptable is True, [r.model_dump() for r in carrots.ranked]
+    assert mint.none_acceptable is False and mint.ranked
+
+
 # --- recipe_from_images (multimodal vision) -----------------------------------
 
 
@@ -4,10 +4,19 @@ bootstrap -> login -> settings round-trip (defaults seeded from yaml) ->
 API token create -> use as bearer -> revoke -> rejected.
 """
 
+import os
+import time
+
+import jwt
+import pytest
 import pytest_asyncio
 
+from remy_api import security
+from remy_api.config import get_settings
 from remy_api.db import get_session_factory
+from remy_api.errors import AuthenticationError
 from remy_api.models import FulfillmentMethod
+from remy_api.security import create_access_token, decode_access_token
 from remy_api.seed import default_favorite_sites, default_pantry_items
 from remy_api.user_service import create_user
 
@@ -69,6 +78,21 @@ async def test_settings_defaults_seeded_from_yaml(bootstrapped):
     assert body["fulfillment_method"] == FulfillmentMethod.PICKUP.value
 
 
+def test_pantry_seed_reloads_when_file_changes(tmp_path, monkeypatch):
+    pantry = tmp_path / "pantry.yaml"
+    pantry.write_text("bypass_staples: [salt, Salt, pepper]\n")
+    monkeypatch.setenv("PANTRY_FILE", str(pantry))
+    first = default_pantry_items()
+    assert first == ["salt", "pepper"]
+    first.append("mutated")  # callers get their own copy
+    assert default_pantry_items() == ["salt", "pepper"]
+
+    pantry.write_text("bypass_staples: [olive oil]\n")
+    stat = pantry.stat()
+    os.utime(pantry, (stat.st_atime, stat.st_mtime + 5))
+    assert default_pantry_items() == ["olive oil"]
+
+
 async def test_settings_update_round_trip(bootstrapped):
     client = bootstrapped
     token = await _login(client)
@@ -194,3 +218,30 @@ async def test_api_token_lifecycle(bootstrapped):
     # Revoking a nonexistent id is 404.
     missing = await client.delete("/users/me/api-tokens/does-not-exist", headers=jwt_headers)
     assert missing.status_code == 404
+
+
+def test_access_token_claims_cached_until_expiry(monkeypatch):
+    token = create_access_token("user-1", auth_version=3)
+    assert decode_access_token(token) == ("user-1", 3)
+
+    # A repeat decode is served from the verified-claims cache, not re-verified.
+    def _no_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode called for a cached token")
+
+    with monkeypatch.context() as m:
+        m.setattr(security.jwt, "decode", _no_decode)
+        assert decode_access_token(token) == ("user-1", 3)
+
+    # An entry past its exp is never served; the token is verified afresh.
+    security._decoded[token] = (int(time.time()) - 1, "someone-else", 9)
+    assert decode_access_token(token) == ("user-1", 3)
+
+    # Expired tokens are rejected and never cached.
+    settings = get_settings()
+    expired = jwt.encode(
+        {"sub": "user-1", "av": 3, "exp": int(time.time()) - 10}, settings.jwt_secret, algorithm=settings.jwt_algorithm
+    )
+    with pytest.raises(AuthenticationError) as exc:
+        decode_access_token(expired)
+    assert exc.value.code == "token_expired"
+    assert expired not in security._decoded
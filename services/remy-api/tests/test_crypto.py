@@ -5,6 +5,7 @@ decrypted through the ORM.
 """
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -48,8 +49,10 @@ async def test_kroger_token_encrypted_at_rest(client, db_path):
         )
         await session.commit()
 
-    # Raw bytes on disk must not contain the plaintext secrets.
-    raw = open(db_path, "rb").read()
+    # Raw bytes on disk must not contain the plaintext secrets. The test DB runs
+    # in WAL mode, so fresh commits sit in the -wal sidecar until a checkpoint.
+    raw = b"".join(Path(db_path + suffix).read_bytes() for suffix in ("", "-wal") if Path(db_path + suffix).exists())
+    assert b"cryptouser" in raw  # the rows really are in the bytes searched
     assert SECRET_ACCESS.encode() not in raw
     assert SECRET_REFRESH.encode() not in raw
 
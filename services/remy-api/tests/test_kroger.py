@@ -219,6 +219,49 @@ async def test_app_token_cached_across_calls():
     assert calls["token"] == 1  # token fetched once, then cached
 
 
+async def test_repeat_product_search_is_cached(monkeypatch):
+    calls = {"products": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/connect/oauth2/token"):
+            return httpx.Response(200, json=_token_body())
+        calls["products"] += 1
+        return httpx.Response(200, json=PRODUCTS_RESPONSE)
+
+    kservice._client = make_client(handler)  # only the shared client is cached
+    first = await search_products(None, "Black  Beans", "70100460")
+    first[0].description = "mutated"  # callers get their own copies
+    again = await search_products(None, "black beans", "70100460")
+    assert calls["products"] == 1
+    assert again[0].description == "Kroger Black Beans"
+    assert again[0].model_copy(update={"description": "mutated"}) == first[0]  # hits round-trip every field
+
+    await search_products(None, "black beans", "70100461")  # other store
+    assert calls["products"] == 2
+
+    monkeypatch.setattr(kservice, "_SEARCH_TTL_SECONDS", 0.0)
+    kservice.clear_search_cache()
+    await search_products(None, "black beans", "70100460")
+    await search_products(None, "black beans", "70100460")
+    assert calls["products"] == 4  # expired entries are refetched
+
+
+async def test_explicit_client_bypasses_search_cache():
+    calls = {"products": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/connect/oauth2/token"):
+            return httpx.Response(200, json=_token_body())
+        calls["products"] += 1
+        return httpx.Response(200, json=PRODUCTS_RESPONSE)
+
+    kservice._client = make_client(handler)
+    await search_products(None, "black beans", "70100460")
+    await search_products(None, "black beans", "70100460", client=make_client(handler))
+    await search_products(None, "black beans", "70100460", client=make_client(handler))
+    assert calls["products"] == 3  # neither explicit client read or filled the cache
+
+
 # --- add_items_to_cart outcome mapping ---------------------------------------
 
 
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -21,6 +22,14 @@ from remy_api.llm import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_output_mode():
+    """The per-model output-mode probe is cached; patched probes must see a cold cache."""
+    client_mod._output_mode.cache_clear()
+    yield
+    client_mod._output_mode.cache_clear()
+
+
 class _Schema(BaseModel):
     name: str
     count: int
@@ -128,3 +137,70 @@ async def test_multimodal_prompt_builds_content_parts(monkeypatch):
     assert len(image_parts) == 2
     assert image_parts[0]["image_url"]["url"] == "data:image/jpeg;base64,Zm9v"
     assert image_parts[1]["image_url"]["url"] == "data:image/png;base64,YmFy"
+
+
+async def test_deterministic_prompt_is_cached(monkeypatch):
+    calls = _stub_acompletion(monkeypatch, ['{"name": "onion", "count": 3}'])
+    client = LLMClient()
+    first = await client.structured(_prompt(), _Schema)
+    first.count = 99  # callers get their own copy; the cache is not mutated
+    second = await client.structured(_prompt(), _Schema)
+    assert calls["n"] == 1
+    assert second.count == 3
+
+
+async def test_sampled_prompt_is_not_cached(monkeypatch):
+    calls = _stub_acompletion(monkeypatch, ['{"name": "onion", "count": 3}'])
+    client = LLMClient()
+    prompt = RenderedPrompt(prompt_id="t", version=1, system="sys", user="usr", temperature=0.7)
+    await client.structured(prompt, _Schema)
+    await client.structured(prompt, _Schema)
+    assert calls["n"] == 2
+
+
+async def test_json_mode_when_schema_output_unsupported(monkeypatch):
+    captured: dict = {}
+
+    async def fake(**kwargs):
+        captured.update(kwargs)
+        return _fake_response('{"name": "a", "count": 1}')
+
+    probes = {"n": 0}
+
+    def supports_schema(**k):
+        probes["n"] += 1
+        return False
+
+    monkeypatch.setattr(client_mod.litellm, "acompletion", fake)
+    monkeypatch.setattr(client_mod.litellm, "supports_response_schema", supports_schema)
+    monkeypatch.setattr(client_mod.litellm, "get_supported_openai_params", lambda **k: ["response_format"])
+    await LLMClient().structured(_prompt(), _Schema)
+    assert captured["response_format"] == {"type": "json_object"}
+    await LLMClient().structured(RenderedPrompt(prompt_id="t", version=1, system="sys", user="other"), _Schema)
+    assert probes["n"] == 1  # probed once per model, not per call
+
+    captured.clear()
+    monkeypatch.setattr(client_mod.litellm, "supports_response_schema", lambda **k: True)
+    client_mod._output_mode.cache_clear()
+    await LLMClient().structured(_prompt(), _Schema)
+    assert captured["response_format"] is _Schema
+
+
+async def test_provider_calls_are_capped(monkeypatch):
+    from remy_api.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "llm_concurrency", 2)
+    state = {"now": 0, "peak": 0}
+
+    async def fake(**kwargs):
+        state["now"] += 1
+        state["peak"] = max(state["peak"], state["now"])
+        await asyncio.sleep(0.01)
+        state["now"] -= 1
+        return _fake_response('{"name": "a", "count": 1}')
+
+    monkeypatch.setattr(client_mod.litellm, "acompletion", fake)
+    client = LLMClient()
+    prompts = [RenderedPrompt(prompt_id="t", version=1, system="sys", user=f"u{i}") for i in range(6)]
+    await asyncio.gather(*(client.structured(p, _Schema) for p in prompts))
+    assert state["peak"] == 2
@@ -0,0 +1,19 @@
+"""The app loggers emit through the background queue listener."""
+
+import logging
+
+from remy_api import logs
+
+
+def test_log_queue_routes_app_loggers_through_listener(capsys):
+    logs.start_log_queue("INFO")
+    try:
+        logs.start_log_queue("INFO")  # idempotent
+        logging.getLogger("remy.planner.matching").info("matched %d items", 3)
+        logging.getLogger("remy_api.net").debug("hidden below INFO")
+    finally:
+        logs.stop_log_queue()
+    err = capsys.readouterr().err
+    assert "INFO remy.planner.matching: matched 3 items" in err
+    assert "hidden" not in err
+    assert logging.getLogger("remy").propagate is True
@@ -17,10 +17,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+from datetime import UTC, datetime
 
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
+from sqlalchemy import select
 
 from remy_api.db import get_session_factory
 from remy_api.mcp_facade import MCP_MOUNT_PATH, attach_mcp_if_enabled
@@ -28,10 +30,10 @@ from remy_api.mcp_facade import context as mcp_context
 from remy_api.mcp_facade.auth import MCPAuthMiddleware
 from remy_api.mcp_facade.tools import build_mcp_server
 from remy_api.models import ApiToken, FulfillmentMethod, UserSettings
-from remy_api.planner import deps, machine
+from remy_api.planner import machine
 from remy_api.recipes import store
 from remy_api.recipes.schemas import ParsedIngredient, ParsedRecipe
-from remy_api.security import generate_api_token
+from remy_api.security import create_access_token, generate_api_token
 from remy_api.user_service import create_user
 
 # Reuse the planner integration test's fakes and helpers verbatim (same mocks).
@@ -42,18 +44,12 @@ from tests.test_planner_flow import (
     FakeLLM,
     FakeSearch,
     _connect_kroger,
+    _patch_dep,
 )
 
 # --- autouse hygiene (mirrors test_planner_flow) -----------------------------
 
 
-@pytest.fixture(autouse=True)
-def _reset_fts_cache():
-    store._fts_available = None
-    yield
-    store._fts_available = None
-
-
 @pytest_asyncio.fixture(autouse=True)
 async def _cancel_planner_tasks():
     yield
@@ -84,8 +80,16 @@ async def _call(server, name: str, user_id: str, **kwargs) -> dict:  # noqa: ANN
 # --- fixture: user + saved recipe + settings + patched collaborators ---------
 
 
+@pytest.fixture(scope="module")
+def mcp_server():
+    """One server for the module: tool registration is stateless per user (the
+    user comes from the ``use_user`` context), so rebuilding it per test only
+    repeats schema generation for every tool."""
+    return build_mcp_server()
+
+
 @pytest_asyncio.fixture
-async def mcp_env(client, monkeypatch):
+async def mcp_env(client, monkeypatch, mcp_server):
     factory = get_session_factory()
     async with factory() as s:
         user = await create_user(s, USERNAME, PASSWORD)
@@ -104,9 +108,7 @@ async def mcp_env(client, monkeypatch):
                 instructions=["cook"],
             ),
         )
-        from sqlalchemy import select as _select
-
-        settings = (await s.execute(_select(UserSettings).where(UserSettings.user_id == user_id))).scalar_one_or_none()
+        settings = (await s.execute(select(UserSettings).where(UserSettings.user_id == user_id))).scalar_one_or_none()
         if settings is None:
             settings = UserSettings(user_id=user_id)
             s.add(settings)
@@ -138,16 +140,15 @@ async def mcp_env(client, monkeypatch):
     async def fake_download(recipe_id, image_url, **kw):
         return None
 
-    monkeypatch.setattr(deps, "get_llm_client", lambda: FakeLLM())
-    monkeypatch.setattr(deps, "get_search_provider", lambda *a, **k: FakeSearch())
-    monkeypatch.setattr(deps, "fetch_thumbnails", fake_thumbs)
-    monkeypatch.setattr(deps, "scrape_recipe", fake_scrape)
-    monkeypatch.setattr(deps, "download_recipe_image", fake_download)
-    monkeypatch.setattr(deps, "kroger_search_products", fake_kroger.search_products)
-    monkeypatch.setattr(deps, "kroger_add_items_to_cart", fake_kroger.add_items_to_cart)
+    _patch_dep(monkeypatch, "get_llm_client", lambda: FakeLLM())
+    _patch_dep(monkeypatch, "get_search_provider", lambda *a, **k: FakeSearch())
+    _patch_dep(monkeypatch, "fetch_thumbnails", fake_thumbs)
+    _patch_dep(monkeypatch, "scrape_recipe", fake_scrape)
+    _patch_dep(monkeypatch, "download_recipe_image", fake_download)
+    _patch_dep(monkeypatch, "kroger_search_products", fake_kroger.search_products)
+    _patch_dep(monkeypatch, "kroger_add_items_to_cart", fake_kroger.add_items_to_cart)
 
-    server = build_mcp_server()
-    return {"server": server, "user_id": user_id, "kroger": fake_kroger, "client": client}
+    return {"server": mcp_server, "user_id": user_id, "kroger": fake_kroger, "client": client}
 
 
 # --- criterion 10: full golden path via tools only --------------------------
@@ -350,8 +351,6 @@ async def test_auth_valid_api_token_binds_user(mcp_env):
 
 
 async def test_auth_revoked_token_rejected(mcp_env):
-    from datetime import UTC, datetime
-
     user_id = mcp_env["user_id"]
     full, token_hash = generate_api_token()
     factory = get_session_factory()
@@ -364,8 +363,6 @@ async def test_auth_revoked_token_rejected(mcp_env):
 
 async def test_auth_jwt_rejected_for_mcp(mcp_env):
     """MCP requires an API token; a web JWT must not authenticate the facade."""
-    from remy_api.security import create_access_token
-
     jwt = create_access_token(mcp_env["user_id"])
     status, uid = await _run_middleware(jwt)
     assert status == 401
@@ -3,7 +3,6 @@
 import io
 
 import httpx
-import pytest
 from PIL import Image
 
 from remy_api.recipes import store
@@ -13,13 +12,6 @@ from remy_api.user_service import create_user
 BASE = "https://mealie.local"
 
 
-@pytest.fixture(autouse=True)
-def _reset_fts_cache():
-    store._fts_available = None
-    yield
-    store._fts_available = None
-
-
 def _png() -> bytes:
     buf = io.BytesIO()
     Image.new("RGB", (300, 200), (40, 160, 90)).save(buf, format="PNG")
@@ -125,3 +117,38 @@ async def test_dry_run_writes_nothing(session):
         stats = await import_mealie(session, user.id, BASE, "k", dry_run=True, client=client)
     assert stats.imported == 2
     assert await store.list_recipes(session, user.id) == []
+
+
+async def test_failed_detail_fetch_does_not_stop_the_rest(session):
+    user = await create_user(session, "owner", "pw-123456")
+    inner = _make_transport()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/recipes/salmon-bowls":
+            return httpx.Response(500)
+        return inner.handle_request(request)
+
+    async with httpx.AsyncClient(base_url=BASE, transport=httpx.MockTransport(handler)) as client:
+        stats = await import_mealie(session, user.id, BASE, "k", client=client)
+    assert (stats.imported, stats.failed) == (1, 1)
+    assert stats.errors[0].startswith("salmon-bowls:")
+
+
+async def test_repeated_slug_is_imported_once(session):
+    user = await create_user(session, "owner", "pw-123456")
+    inner = _make_transport()
+    details: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/recipes":
+            items = [{"slug": "salmon-bowls"}, {"slug": "chicken-tikka-masala"}, {"slug": "salmon-bowls"}]
+            return httpx.Response(200, json={"items": items, "total_pages": 1})
+        if request.url.path.startswith("/api/recipes/"):
+            details.append(request.url.path)
+        return inner.handle_request(request)
+
+    async with httpx.AsyncClient(base_url=BASE, transport=httpx.MockTransport(handler)) as client:
+        stats = await import_mealie(session, user.id, BASE, "k", client=client)
+    assert (stats.imported, stats.failed) == (2, 0)
+    assert sorted(details) == ["/api/recipes/chicken-tikka-masala", "/api/recipes/salmon-bowls"]
+    assert len(await store.list_recipes(session, user.id)) == 2
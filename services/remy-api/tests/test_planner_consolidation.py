@@ -105,3 +105,29 @@ def test_pantry_sliced_does_not_match_ice():
 def test_classify_pantry_maps_each_food():
     result = classify_pantry(["salt", "sliced almond", "chicken thigh"], ["salt", "ice", "pepper"])
     assert result == {"salt": True, "sliced almond": False, "chicken thigh": False}
+
+
+def test_classify_pantry_normalizes_and_handles_empty_pantry():
+    result = classify_pantry(["Salt", "salt ", "", "garlic"], ["salt"])
+    assert result == {"Salt": True, "salt ": True, "": False, "garlic": False}
+    assert classify_pantry(["salt"], []) == {"salt": False}
+
+
+def test_pantry_alternation_matches_any_term_and_empty_pantry():
+    pattern = compile_pantry(["ice", "rice", " ", "Oil"])
+    # "ice" fails the boundary inside "sliced" but "rice" still matches later on.
+    assert matches_pantry("sliced rice noodle", pattern) is True
+    assert matches_pantry("sesame oil", pattern) is True
+    assert matches_pantry("sliced almond", pattern) is False
+    assert matches_pantry("salt", compile_pantry([])) is False
+
+
+def test_prefix_factored_pantry_matches_plain_alternation():
+    import re
+
+    pantry = ["ice", "iced tea", "oil", "olive oil", "salt", "sea salt", "soy sauce", "sugar", "s"]
+    foods = ["sliced almond", "iced tea", "olive", "olive oil", "salted butter", "sea salt", "soy", "s", "sugars"]
+    plain = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in pantry) + r")\b")
+    pattern = compile_pantry(pantry)
+    for food in foods:
+        assert matches_pantry(food, pattern) is (plain.search(food) is not None), food
@@ -1,5 +1,11 @@
+import asyncio
+
+from remy_api.db import get_session_factory
+from remy_api.models import Plan, PlanStatus
+from remy_api.planner import discover
 from remy_api.planner.discover import _dedup
-from remy_api.planner.schemas import Candidate, Origin
+from remy_api.planner.schemas import Candidate, Meal, MealStatus, Origin
+from remy_api.user_service import create_user
 
 
 def test_saved_recipe_suppresses_web_result_with_same_canonical_url():
@@ -33,3 +39,54 @@ def test_saved_recipe_dedupe_url_is_not_exposed_in_plan_state():
     )
 
     assert "dedupe_url" not in candidate.model_dump()
+
+
+async def test_slow_meal_times_out_without_blocking_the_step(session, monkeypatch):
+    user = await create_user(session, "owner", "sup3r-secret-pw")
+    meals = [Meal(id="m1", query="tacos", verbatim="tacos"), Meal(id="m2", query="soup", verbatim="soup")]
+    plan = Plan(user_id=user.id, status=PlanStatus.DISCOVERING, meals=[m.model_dump() for m in meals])
+    session.add(plan)
+    await session.commit()
+
+    async def fake_discover(meal, favorite_sites, user_id):
+        if meal.id == "m1":
+            await asyncio.sleep(10)
+        return discover.MealCandidates(meal_id=meal.id, status=MealStatus.READY)
+
+    monkeypatch.setattr(discover, "discover_meal", fake_discover)
+    monkeypatch.setattr(discover, "_MEAL_TIMEOUT_SECONDS", 0.05)
+    await discover.run_discover(plan.id)
+
+    async with get_session_factory()() as s:
+        stored = await s.get(Plan, plan.id)
+    assert stored.status == PlanStatus.SELECTING
+    assert stored.candidates["m1"]["status"] == MealStatus.ERROR
+    assert stored.candidates["m1"]["source_errors"] == ["discover_timeout"]
+    assert stored.candidates["m2"]["status"] == MealStatus.READY
+
+
+async def test_identical_meals_share_one_discovery(session, monkeypatch):
+    user = await create_user(session, "owner", "sup3r-secret-pw")
+    meals = [
+        Meal(id="m1", query="tacos", verbatim="tacos"),
+        Meal(id="m2", query="tacos", verbatim="tacos"),
+        Meal(id="m3", query="soup", verbatim="soup"),
+    ]
+    plan = Plan(user_id=user.id, status=PlanStatus.DISCOVERING, meals=[m.model_dump() for m in meals])
+    session.add(plan)
+    await session.commit()
+
+    queries: list[str] = []
+
+    async def fake_discover(meal, favorite_sites, user_id):
+        queries.append(meal.query)
+        return discover.MealCandidates(meal_id=meal.id, status=MealStatus.READY)
+
+    monkeypatch.setattr(discover, "discover_meal", fake_discover)
+    await discover.run_discover(plan.id)
+
+    assert sorted(queries) == ["soup", "tacos"]
+    async with get_session_factory()() as s:
+        stored = await s.get(Plan, plan.id)
+    assert {mid: c["meal_id"] for mid, c in stored.candidates.items()} == {"m1": "m1", "m2": "m2", "m3": "m3"}
+    assert all(c["status"] == MealStatus.READY for c in stored.candidates.values())
@@ -9,16 +9,21 @@ not_found, alternatives, estimated total), cart edits (swap + drop), execute
 abandon, and resume-snapshot fidelity.
 """
 
+import asyncio
+import contextlib
+import inspect
 import json
 import re
+from datetime import UTC, datetime, timedelta
 
 import pytest
 import pytest_asyncio
 
 from remy_api.db import get_session_factory
 from remy_api.kroger.models import CartItemOutcome, Modality, OutcomeStatus, Price, Product, StockLevel
-from remy_api.models import KrogerToken, Order
-from remy_api.planner import deps, machine
+from remy_api.models import KrogerToken, Order, Plan, PlanStatus
+from remy_api.planner import deps, execute, machine, matching, select_step
+from remy_api.planner.schemas import CartState, ItemStatus, ListLine, MatchItem, ProductRef
 from remy_api.prompts import (
     ingredient_parsing,
     listicle_filter,
@@ -28,6 +33,7 @@ from remy_api.prompts import (
     saved_recipe_relevance,
 )
 from remy_api.recipes import store
+from remy_api.recipes.llm_fallback import RecipeParseError
 from remy_api.recipes.schemas import ParsedIngredient, ParsedRecipe
 from remy_api.search.base import SearchError, SearchResult
 from remy_api.user_service import create_user
@@ -64,6 +70,15 @@ class FakeLLM:
         # term -> (ranked_indices | None, none_acceptable)
         self.ranking = {"chicken thigh": (None, True)}
 
+    def _rank(self, term, products):
+        ranked_idx, none_acceptable = self.ranking.get(term, (None, False))
+        if none_acceptable:
+            return product_ranking.ProductRankingOutput(ranked=[], none_acceptable=True)
+        order = ranked_idx if ranked_idx is not None else list(range(len(products)))
+        return product_ranking.ProductRankingOutput(
+            ranked=[product_ranking.RankedProduct(index=i, reason="ok") for i in order]
+        )
+
     async def structured(self, prompt, schema):
         pid = prompt.prompt_id
         if pid == meal_extraction.PROMPT_ID:
@@ -101,13 +116,16 @@ class FakeLLM:
             return product_extraction.ProductExtractionOutput(items=items)
         if pid == product_ranking.PROMPT_ID:
             term = re.search(r'Search term:\s*"([^"]+)"', prompt.user).group(1)
-            products = _tail_json(prompt.user)
-            ranked_idx, none_acceptable = self.ranking.get(term, (None, False))
-            if none_acceptable:
-                return product_ranking.ProductRankingOutput(ranked=[], none_acceptable=True)
-            order = ranked_idx if ranked_idx is not None else list(range(len(products)))
-            return product_ranking.ProductRankingOutput(
-                ranked=[product_ranking.RankedProduct(index=i, reason="ok") for i in order]
+            return self._rank(term, _tail_json(prompt.user))
+        if pid == product_ranking.PROMPT_ID_BATCH:
+            rows = _tail_json(prompt.user)
+            return product_ranking.ProductRankingBatchOutput(
+                items=[
+                    product_ranking.ProductRankingBatchItem(
+                        index=r["index"], **self._rank(r["search_term"], r["products"]).model_dump()
+                    )
+                    for r in rows
+                ]
             )
         raise AssertionError(f"unexpected prompt id {pid}")
 
@@ -213,21 +231,11 @@ class FakeKroger:
 # --- fixtures ----------------------------------------------------------------
 
 
-@pytest.fixture(autouse=True)
-def _reset_fts_cache():
-    store._fts_available = None
-    yield
-    store._fts_available = None
-
-
 @pytest_asyncio.fixture(autouse=True)
 async def _cancel_planner_tasks():
     """Cancel any lingering background step tasks so they can't run into the next
     test's schema reset (e.g. a re-plan that launches discover without draining)."""
     yield
-    import asyncio
-    import contextlib
-
     for task in list(machine._tasks.values()):
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError, Exception):
@@ -236,6 +244,25 @@ async def _cancel_planner_tasks():
     machine._locks.clear()
 
 
+def _patch_dep(monkeypatch, name: str, fake) -> None:  # noqa: ANN001
+    """Patch ``deps.<name>`` with ``fake`` once it accepts the real call shape.
+
+    The fakes are plain functions, not specced mocks, so this is their spec:
+    if a real collaborator gains or renames a parameter the fixture fails here
+    instead of the fake silently diverging from production.
+    """
+    args, kwargs = [], {}
+    for param in inspect.signature(getattr(deps, name)).parameters.values():
+        if param.kind is param.POSITIONAL_ONLY or (
+            param.kind is param.POSITIONAL_OR_KEYWORD and param.default is param.empty
+        ):
+            args.append(None)
+        elif param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+            kwargs[param.name] = None
+    inspect.signature(fake).bind(*args, **kwargs)
+    monkeypatch.setattr(deps, name, fake)
+
+
 @pytest_asyncio.fixture
 async def env(client, monkeypatch):
     factory = get_session_factory()
@@ -299,21 +326,19 @@ async def env(client, monkeypatch):
     async def fake_download(recipe_id, image_url, **kw):
         return None
 
-    monkeypatch.setattr(deps, "get_llm_client", lambda: fake_llm)
-    monkeypatch.setattr(deps, "get_search_provider", lambda *a, **k: fake_search)
-    monkeypatch.setattr(deps, "fetch_thumbnails", fake_thumbs)
-    monkeypatch.setattr(deps, "cache_thumbnail_images", fake_cache_thumbnails)
-    monkeypatch.setattr(deps, "scrape_recipe", fake_scrape)
-    monkeypatch.setattr(deps, "download_recipe_image", fake_download)
-    monkeypatch.setattr(deps, "kroger_search_products", fake_kroger.search_products)
-    monkeypatch.setattr(deps, "kroger_add_items_to_cart", fake_kroger.add_items_to_cart)
+    _patch_dep(monkeypatch, "get_llm_client", lambda: fake_llm)
+    _patch_dep(monkeypatch, "get_search_provider", lambda *a, **k: fake_search)
+    _patch_dep(monkeypatch, "fetch_thumbnails", fake_thumbs)
+    _patch_dep(monkeypatch, "cache_thumbnail_images", fake_cache_thumbnails)
+    _patch_dep(monkeypatch, "scrape_recipe", fake_scrape)
+    _patch_dep(monkeypatch, "download_recipe_image", fake_download)
+    _patch_dep(monkeypatch, "kroger_search_products", fake_kroger.search_products)
+    _patch_dep(monkeypatch, "kroger_add_items_to_cart", fake_kroger.add_items_to_cart)
 
     return {"client": client, "headers": headers, "user_id": user_id, "kroger": fake_kroger}
 
 
 async def _connect_kroger(user_id):
-    from datetime import UTC, datetime, timedelta
-
     factory = get_session_factory()
     async with factory() as s:
         s.add(
@@ -327,6 +352,30 @@ async def _connect_kroger(user_id):
         await s.commit()
 
 
+@pytest_asyncio.fixture
+async def discovered(env):
+    """``env`` with a two-meal plan already discovered; returns its ``selecting`` state."""
+    client, headers = env["client"], env["headers"]
+    created = await client.post("/plan", json={"text": "chicken tikka masala and tacos"}, headers=headers)
+    assert created.status_code == 201, created.text
+    await machine.drain(env["user_id"])
+    return (await client.get("/plan/state", headers=headers)).json()
+
+
+def _saved_and_street_choices(state: dict) -> list[dict]:
+    """Select the saved tikka recipe and the tacos.com/street web candidate."""
+    meal_a = next(m for m in state["meals"] if "tikka" in m["query"])
+    meal_b = next(m for m in state["meals"] if m["query"] == "tacos")
+    saved_cand = next(c for c in state["candidates"][meal_a["id"]]["candidates"] if c["origin"] == "saved")
+    web_cand = next(
+        c for c in state["candidates"][meal_b["id"]]["candidates"] if c["url"] == "https://tacos.com/street"
+    )
+    return [
+        {"meal_id": meal_a["id"], "choice": "candidate", "candidate_id": saved_cand["id"]},
+        {"meal_id": meal_b["id"], "choice": "candidate", "candidate_id": web_cand["id"]},
+    ]
+
+
 # --- tests -------------------------------------------------------------------
 
 
@@ -363,20 +412,8 @@ async def test_full_golden_path(env):
     street = next(c for c in cand_b["candidates"] if c["url"] == "https://tacos.com/street")
     assert street["thumbnail"] == f"/plan/thumbnails/{'a' * 64}"
 
-    saved_cand = next(c for c in cand_a["candidates"] if c["origin"] == "saved")
-    web_cand = next(c for c in cand_b["candidates"] if c["url"] == "https://tacos.com/street")
-
     # --- select (one saved, one web-scraped) ---
-    sel = await client.post(
-        "/plan/select",
-        json={
-            "choices": [
-                {"meal_id": meal_a["id"], "choice": "candidate", "candidate_id": saved_cand["id"]},
-                {"meal_id": meal_b["id"], "choice": "candidate", "candidate_id": web_cand["id"]},
-            ]
-        },
-        headers=headers,
-    )
+    sel = await client.post("/plan/select", json={"choices": _saved_and_street_choices(state)}, headers=headers)
     assert sel.status_code == 200, sel.text
     body = sel.json()
     assert body["status"] == "reviewing_list"
@@ -469,20 +506,16 @@ async def test_full_golden_path(env):
     assert orders[0].plan_id is not None
 
 
-async def test_one_active_plan_conflict(env):
-    client, headers, user_id = env["client"], env["headers"], env["user_id"]
-    first = await client.post("/plan", json={"text": "tacos"}, headers=headers)
-    assert first.status_code == 201
-    await machine.drain(user_id)
+async def test_one_active_plan_conflict(env, discovered):
+    client, headers = env["client"], env["headers"]
     second = await client.post("/plan", json={"text": "pasta"}, headers=headers)
     assert second.status_code == 409
     assert second.json()["error"]["code"] == "plan_active"
 
 
-async def test_wrong_state_operation_conflict(env):
-    client, headers, user_id = env["client"], env["headers"], env["user_id"]
-    await client.post("/plan", json={"text": "tacos"}, headers=headers)
-    await machine.drain(user_id)
+async def test_wrong_state_operation_conflict(env, discovered):
+    client, headers = env["client"], env["headers"]
+    assert discovered["status"] == "selecting"
     # In 'selecting', execute is invalid.
     resp = await client.post("/plan/cart/execute", headers=headers)
     assert resp.status_code == 409
@@ -490,41 +523,181 @@ async def test_wrong_state_operation_conflict(env):
     assert "selecting" in resp.json()["error"]["message"]
 
 
-async def test_abandon_then_replan(env):
+async def test_abandon_then_replan(env, discovered):
     client, headers, user_id = env["client"], env["headers"], env["user_id"]
-    await client.post("/plan", json={"text": "tacos"}, headers=headers)
-    await machine.drain(user_id)
     deleted = await client.delete("/plan", headers=headers)
     assert deleted.status_code == 204
     assert (await client.get("/plan/state", headers=headers)).status_code == 404
     # A fresh plan is now allowed (no lingering active plan).
     again = await client.post("/plan", json={"text": "chicken tikka masala and tacos"}, headers=headers)
     assert again.status_code == 201
+    # Let the new plan's discover finish inside this test's loop: a step task
+    # still running when the test returns is cancelled mid-write and its
+    # SQLite connection can hold the lock into the next test's setup.
+    await machine.drain(user_id)
 
 
-async def test_resume_snapshot_fidelity_midflow(env):
+async def test_two_users_plan_concurrently(env):
     client, headers, user_id = env["client"], env["headers"], env["user_id"]
-    await client.post("/plan", json={"text": "chicken tikka masala and tacos"}, headers=headers)
-    await machine.drain(user_id)
-    state = (await client.get("/plan/state", headers=headers)).json()
-    meal_a = next(m for m in state["meals"] if "tikka" in m["query"])
-    meal_b = next(m for m in state["meals"] if m["query"] == "tacos")
-    saved_cand = next(c for c in state["candidates"][meal_a["id"]]["candidates"] if c["origin"] == "saved")
-    web_cand = next(
-        c for c in state["candidates"][meal_b["id"]]["candidates"] if c["url"] == "https://tacos.com/street"
-    )
-    await client.post(
-        "/plan/select",
-        json={
-            "choices": [
-                {"meal_id": meal_a["id"], "choice": "candidate", "candidate_id": saved_cand["id"]},
-                {"meal_id": meal_b["id"], "choice": "candidate", "candidate_id": web_cand["id"]},
-            ]
-        },
-        headers=headers,
+    factory = get_session_factory()
+    async with factory() as s:
+        other_id = (await create_user(s, "second", PASSWORD)).id
+    login = await client.post("/auth/login", json={"username": "second", "password": PASSWORD})
+    other_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    # Independent users share nothing but the DB: both plans start and discover at once.
+    created = await asyncio.gather(
+        client.post("/plan", json={"text": "tacos"}, headers=headers),
+        client.post("/plan", json={"text": "tacos"}, headers=other_headers),
     )
+    assert [r.status_code for r in created] == [201, 201]
+    await asyncio.gather(machine.drain(user_id), machine.drain(other_id))
+
+    states = [(await client.get("/plan/state", headers=h)).json() for h in (headers, other_headers)]
+    assert [st["status"] for st in states] == ["selecting", "selecting"]
+    assert states[0]["plan_id"] != states[1]["plan_id"]
+
+
+async def test_resume_snapshot_fidelity_midflow(env, discovered):
+    client, headers = env["client"], env["headers"]
+    await client.post("/plan/select", json={"choices": _saved_and_street_choices(discovered)}, headers=headers)
     # A brand-new GET (as if the browser was killed and reopened) resumes intact.
     resumed = (await client.get("/plan/state", headers=headers)).json()
     assert resumed["status"] == "reviewing_list"
     foods = {ln["food"] for ln in resumed["shopping_list"]["lines"]}
     assert {"onion", "salt", "sliced almond", "black bean"} <= foods
+
+
+async def test_crashed_rank_batch_falls_back_to_concurrent_single_ranks(env, discovered, monkeypatch):
+    client, headers = env["client"], env["headers"]
+    await client.post("/plan/select", json={"choices": _saved_and_street_choices(discovered)}, headers=headers)
+    inner = FakeLLM()
+    state = {"now": 0, "peak": 0}
+
+    class BatchCrashingLLM:
+        async def structured(self, prompt, schema):
+            if prompt.prompt_id == product_ranking.PROMPT_ID_BATCH:
+                raise RuntimeError("batch ranking blew up")
+            if prompt.prompt_id == product_ranking.PROMPT_ID:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+                await asyncio.sleep(0.01)
+                state["now"] -= 1
+            return await inner.structured(prompt, schema)
+
+    _patch_dep(monkeypatch, "get_llm_client", lambda: BatchCrashingLLM())
+    approved = await client.post("/plan/list/approve", headers=headers)
+    assert approved.status_code == 200, approved.text
+    await machine.drain(env["user_id"])
+
+    cart = (await client.get("/plan/state", headers=headers)).json()["cart"]
+    assert cart["status"] == "ready"
+    assert state["peak"] > 1  # the per-item fallbacks overlap, not one slot in series
+    items = {it["search_term"]: it for it in cart["items"]}
+    assert items["onion"]["status"] == "matched"
+    assert items["chicken thigh"]["status"] == "not_found"
+
+
+async def test_match_extraction_rebatches_skipped_lines(monkeypatch):
+    calls: list[str] = []
+
+    class SkippingLLM:
+        async def structured(self, prompt, schema):
+            calls.append(prompt.prompt_id)
+            lines = _tail_json(prompt.user)
+            # First batch skips the last line; the re-batch covers it.
+            keep = lines[:-1] if len(calls) == 1 else lines
+            return product_extraction.ProductExtractionOutput(
+                items=[
+                    product_extraction.ProductExtractionItem(
+                        index=i,
+                        products=[
+                            product_extraction.ExtractedProduct(
+                                search_term=r["food"], package_quantity=1, confidence=0.9
+                            )
+                        ],
+                    )
+                    for i, r in enumerate(keep)
+                ]
+            )
+
+    monkeypatch.setattr(deps, "get_llm_client", lambda: SkippingLLM())
+    lines = [ListLine(id=f"l{i}", display=f, food=f, quantity=1) for i, f in enumerate(["onion", "garlic", "salt"])]
+    out = await matching._extract_products(lines)
+    assert calls == [product_extraction.PROMPT_ID, product_extraction.PROMPT_ID]
+    assert [p[0].search_term for p in out.values()] == ["onion", "garlic", "salt"]
+
+
+async def test_match_coalesces_identical_search_terms(monkeypatch):
+    fake_kroger = FakeKroger()
+    terms: list[str] = []
+
+    async def counting_search(session, term, location_id, **kw):
+        terms.append(term)
+        return await fake_kroger.search_products(session, term, location_id, **kw)
+
+    monkeypatch.setattr(deps, "kroger_search_products", counting_search)
+    items = [
+        MatchItem(id=str(i), line_id=f"l{i}", search_term=t, status=ItemStatus.MATCHING)
+        for i, t in enumerate(["onion", "Onion ", "sliced almond"])
+    ]
+    results = await matching._search_all(items, "loc", "pickup", asyncio.Semaphore(4))
+    assert sorted(terms) == ["onion", "sliced almond"]
+    assert results[0] is results[1]
+    assert [p.upc for p in results[2]] == ["al1", "al2"]
+
+
+async def test_select_scrapes_web_choices_concurrently(monkeypatch):
+    state = {"now": 0, "peak": 0}
+
+    async def slow_scrape(url, **kw):
+        state["now"] += 1
+        state["peak"] = max(state["peak"], state["now"])
+        await asyncio.sleep(0.01)
+        state["now"] -= 1
+        if "bad" in url:
+            raise RecipeParseError("no recipe here")
+        return ParsedRecipe(title=url, ingredients=[], instructions=[])
+
+    monkeypatch.setattr(deps, "scrape_recipe", slow_scrape)
+    monkeypatch.setattr(deps, "get_prompt_id_llm", lambda: None)
+    urls = ["https://a.example/r", "https://bad.example/r", "https://a.example/r", "https://c.example/r"]
+    scraped = await select_step._scrape_all(urls)
+    assert state["peak"] == 3  # duplicates collapse; the rest run together
+    assert scraped["https://a.example/r"].title == "https://a.example/r"
+    assert isinstance(scraped["https://bad.example/r"], RecipeParseError)
+
+
+async def test_links_only_message_skips_meal_extraction(monkeypatch):
+    class NoLLM:
+        async def structured(self, prompt, schema):
+            raise AssertionError(f"unexpected LLM call: {prompt.prompt_id}")
+
+    monkeypatch.setattr(deps, "get_llm_client", lambda: NoLLM())
+    meals = await machine._extract_meals("https://www.seriouseats.com/tacos\n https://smittenkitchen.com/x")
+    assert [(m.url, m.verbatim, m.query, m.is_specific) for m in meals] == [
+        ("https://www.seriouseats.com/tacos", "seriouseats.com", "", True),
+        ("https://smittenkitchen.com/x", "smittenkitchen.com", "", True),
+    ]
+    assert machine._url_only_meals("tacos https://smittenkitchen.com/x") is None
+
+
+async def test_execute_sums_lines_sharing_a_upc(session, monkeypatch):
+    user = await create_user(session, "owner", "sup3r-secret-pw")
+    await _connect_kroger(user.id)
+    fake_kroger = FakeKroger()
+    monkeypatch.setattr(deps, "kroger_add_items_to_cart", fake_kroger.add_items_to_cart)
+    onion = ProductRef(upc="on1", description="Yellow Onion", price=1.0)
+    cart = CartState(
+        items=[
+            MatchItem(id="a", line_id="l1", search_term="onion", count=2, status=ItemStatus.MATCHED, chosen=onion),
+            MatchItem(id="b", line_id="l2", search_term="red onion", status=ItemStatus.MATCHED, chosen=onion),
+        ]
+    )
+    plan = Plan(user_id=user.id, status=PlanStatus.REVIEWING_CART, matches=cart.model_dump(mode="json"))
+    session.add(plan)
+    await session.commit()
+
+    await execute.execute_plan(session, plan)
+    assert fake_kroger.cart_calls == [[{"upc": "on1", "quantity": 3, "modality": "PICKUP"}]]
+    assert [i["status"] for i in plan.execution_results["items"]] == ["added", "added"]
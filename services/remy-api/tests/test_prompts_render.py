@@ -19,6 +19,7 @@ from remy_api.prompts import (
     recipe_from_images,
     saved_recipe_relevance,
 )
+from remy_api.prompts.base import json_block
 from remy_api.prompts.listicle_filter import (
     SearchCandidate,
     is_listicle_title,
@@ -29,6 +30,11 @@ from remy_api.prompts.rules import PRODUCT_RULES
 FIXTURES = Path(__file__).parent / "prompts" / "fixtures"
 
 
+def test_json_block_matches_stdlib_layout():
+    data = [{"index": 0, "description": "Crème fraîche ☃", "price": 1.19, "tags": [], "meta": {}, "x": None}]
+    assert json_block(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
 # --- render functions produce a valid RenderedPrompt --------------------------
 
 
@@ -111,6 +117,19 @@ def test_product_ranking_render_includes_price_and_target_size():
     assert "1.19" in p.user and "15 oz" in p.user and "Target size" in p.user
 
 
+def test_product_ranking_batch_shares_rules_and_indexes_terms():
+    item = product_ranking.ProductRankingInput(
+        search_term="canned black beans",
+        products=[product_ranking.RankableProduct(description="Kroger Black Beans", price=1.19)],
+    )
+    batch = product_ranking.render_batch(product_ranking.ProductRankingBatchInput(items=[item, item]))
+    single = product_ranking.render(item)
+    rules = single.system[single.system.index("Ranking rules:") :]
+    assert rules in batch.system
+    assert batch.prompt_id != single.prompt_id
+    assert '"search_term": "canned black beans"' in batch.user and '"index": 1' in batch.user
+
+
 # --- recipe_from_images (multimodal) render -----------------------------------
 
 
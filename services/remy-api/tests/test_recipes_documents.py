@@ -2,12 +2,14 @@
 
 Fixtures are generated in-process (Pillow for images, reportlab for a text-native
 PDF, Pillow-into-PDF for a scanned/image PDF) so no binary blobs live in the
-repo. No LLM is involved — these test classification, routing, and limits only.
+repo; each distinct fixture is encoded once per session (bytes are immutable).
+No LLM is involved — these test classification, routing, and limits only.
 """
 
 from __future__ import annotations
 
 import io
+from functools import lru_cache
 
 import pytest
 from PIL import Image
@@ -22,12 +24,14 @@ from remy_api.recipes.documents import (
 )
 
 
+@lru_cache
 def _image_bytes(fmt: str = "PNG", size=(320, 240), color=(200, 120, 60)) -> bytes:
     buf = io.BytesIO()
     Image.new("RGB", size, color).save(buf, format=fmt)
     return buf.getvalue()
 
 
+@lru_cache
 def _text_pdf_bytes() -> bytes:
     """A real text-native PDF (embedded selectable text) via reportlab."""
     from reportlab.lib.pagesizes import letter
@@ -55,6 +59,7 @@ def _text_pdf_bytes() -> bytes:
     return buf.getvalue()
 
 
+@lru_cache
 def _scanned_pdf_bytes() -> bytes:
     """An image-only PDF (a photo saved as a PDF page — no extractable text)."""
     buf = io.BytesIO()
@@ -1,6 +1,7 @@
 """Image pipeline: download → re-encode → store, plus graceful failure."""
 
 import io
+from functools import lru_cache
 
 import httpx
 from PIL import Image
@@ -8,6 +9,7 @@ from PIL import Image
 from remy_api.recipes import images
 
 
+@lru_cache
 def _png_bytes(size=(2000, 1500), color=(200, 30, 30)) -> bytes:
     buf = io.BytesIO()
     Image.new("RGB", size, color).save(buf, format="PNG")
@@ -2,12 +2,10 @@
 
 import io
 
-import pytest
 import pytest_asyncio
 from PIL import Image
 
 from remy_api.db import get_session_factory
-from remy_api.recipes import store
 from remy_api.recipes.llm_fallback import RecipeParseError
 from remy_api.recipes.schemas import ParsedIngredient, ParsedRecipe
 from remy_api.user_service import create_user
@@ -16,13 +14,6 @@ USERNAME = "owner"
 PASSWORD = "sup3r-secret-pw"
 
 
-@pytest.fixture(autouse=True)
-def _reset_fts_cache():
-    store._fts_available = None
-    yield
-    store._fts_available = None
-
-
 @pytest_asyncio.fixture
 async def auth(client):
     factory = get_session_factory()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import httpx
 import pytest
 
@@ -128,6 +130,30 @@ def test_llm_provider_detects_supported():
     assert LLMSearchProvider(model="openai/gpt-4o")._provider == "openai"
 
 
+def _stub_llm_reply(monkeypatch, content: str) -> None:
+    """Make every litellm completion return ``content`` as the message text."""
+    reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    async def fake(**kwargs):
+        return reply
+
+    monkeypatch.setattr("remy_api.search.llm_provider.litellm.acompletion", fake)
+
+
+async def test_llm_provider_fenced_reply_is_a_provider_error(monkeypatch):
+    # No fence stripping of LLM output (PRD §7.1); a fenced envelope is unparseable.
+    body = '```json\n{"results": [{"title": "Tacos", "url": "https://x.com/t", "snippet": ""}]}\n```'
+    _stub_llm_reply(monkeypatch, body)
+    with pytest.raises(SearchProviderError, match="unparseable"):
+        await LLMSearchProvider(model="anthropic/claude-sonnet-4-5").search("tacos")
+
+
+async def test_llm_provider_blank_reply_is_a_provider_error(monkeypatch):
+    _stub_llm_reply(monkeypatch, "  \n")
+    with pytest.raises(SearchProviderError, match="no content"):
+        await LLMSearchProvider(model="anthropic/claude-sonnet-4-5").search("tacos")
+
+
 # --- SearXNG ---
 
 _SEARXNG_PAYLOAD = {
@@ -195,6 +221,67 @@ async def test_searxng_max_results_truncation(monkeypatch):
     assert results[0].url == "https://x.com/tacos"
 
 
+async def test_searches_reuse_pooled_client(monkeypatch):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"results": []}))
+    real_client = httpx.AsyncClient
+    built = []
+
+    def factory(*args, **kwargs):
+        built.append(kwargs)
+        return real_client(*args, transport=transport, **kwargs)
+
+    monkeypatch.setattr("remy_api.net.httpx.AsyncClient", factory)
+    provider = SearxngSearchProvider(base_url="http://searxng:8080", timeout=5)
+    await provider.search("tacos")
+    await provider.search("pasta", site="budgetbytes.com")
+    await SearxngSearchProvider(base_url="http://searxng:8080", timeout=5).search("soup")
+    assert len(built) == 1
+
+
+async def test_pooled_client_keeps_no_cookies(monkeypatch):
+    from remy_api import net
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "session=abc; Path=/"})
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr("remy_api.net.httpx.AsyncClient", lambda *a, **k: real_client(*a, transport=transport, **k))
+    await net.get_http_client().get("https://a.example/")
+    await net.get_http_client().get("https://a.example/again")
+    assert sent == [None, None]
+
+
+async def test_impersonated_fetches_share_one_session(monkeypatch):
+    from remy_api import net
+
+    sessions = []
+
+    class FakeSession:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            self.closed = False
+            sessions.append(self)
+
+        async def get(self, url, **kwargs):
+            return SimpleNamespace(status_code=200, content=b"<html>", headers={"content-type": "text/html"})
+
+        async def close(self):
+            self.closed = True
+
+    monkeypatch.setattr("curl_cffi.AsyncSession", FakeSession)
+    await net.impersonated_get("https://a.example/", timeout=5)
+    status, content, _ = await net.impersonated_get("https://b.example/", timeout=5, max_bytes=2)
+    assert (status, content) == (200, b"<ht")
+    assert len(sessions) == 1
+    assert sessions[0].kwargs == {"discard_cookies": True}
+    await net.close_http_client()
+    assert sessions[0].closed
+
+
 async def test_searxng_403_is_provider_error(monkeypatch):
     def handler(request):
         return httpx.Response(403, text="forbidden")